@@ -7,6 +7,7 @@ from altair import Padding
 import streamlit as st
 import pandas as pd
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from src.data_loader import calculate_returns
 from src.metrics import calculate_all_metrics, create_sip_progression_table
 from src.computation_cache import (
@@ -33,6 +34,34 @@ from src.visualizations import (
 from utils.helpers import create_metrics_comparison_df, get_period_description, create_metric_category_df, highlight_outliers_in_monthly_table, format_sip_table
 from src.shared_components import filter_funds_by_plan_type
 
+# Figure-level cache: Streamlit reruns the whole script on every widget
+# interaction, so without this every chart is rebuilt even when its inputs
+# did not change. Keys are content hashes of the input series/tables.
+_PANDAS_HASH = {
+    pd.Series: lambda s: pd.util.hash_pandas_object(s).sum(),
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df.astype(str)).sum(),
+}
+
+_CHART_BUILDERS = {
+    fn.__name__: fn
+    for fn in (
+        create_sip_portfolio_chart,
+        create_cumulative_returns_chart,
+        create_drawdown_comparison_chart,
+        create_annual_returns_chart,
+        create_rolling_returns_chart,
+        create_rolling_volatility_chart,
+        create_rolling_beta_chart,
+        create_rolling_correlation_chart,
+    )
+}
+
+
+@st.cache_data(max_entries=64, show_spinner=False, hash_funcs=_PANDAS_HASH)
+def _cached_chart(builder_name, *args, **kwargs):
+    """Build a chart figure, or fetch it when the inputs are unchanged"""
+    return _CHART_BUILDERS[builder_name](*args, **kwargs)
+
 
 def render(data_loader):
     """Render the Fund Deepdive page
@@ -578,6 +607,30 @@ def render(data_loader):
     # === SECTION 2A: PERFORMANCE OVERVIEW ===
 
     # Individual performance charts (SIP + Cumulative + Drawdown + Annual)
+    # Build the four figures concurrently — the heavy numpy/pandas kernels
+    # inside release the GIL, so the builds overlap; rendering stays on the
+    # main thread where Streamlit requires it
+    comparison_name_or_none = comparison_name_clean if comparison_returns is not None else None
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        sip_future = pool.submit(
+            _cached_chart, 'create_sip_portfolio_chart',
+            sip_table_df, strategy_name_clean, benchmark_name, comparison_name_or_none
+        )
+        cumulative_future = pool.submit(
+            _cached_chart, 'create_cumulative_returns_chart',
+            strategy_returns, benchmark_returns, strategy_name_clean, benchmark_name,
+            comparison_returns, comparison_name_or_none, log_scale
+        )
+        drawdown_future = pool.submit(
+            _cached_chart, 'create_drawdown_comparison_chart',
+            strategy_returns, benchmark_returns, strategy_name_clean, benchmark_name,
+            comparison_returns, comparison_name_or_none
+        )
+        annual_future = pool.submit(
+            _cached_chart, 'create_annual_returns_chart',
+            strategy_returns, benchmark_returns, strategy_name_clean, benchmark_name,
+            comparison_returns, comparison_name_or_none
+        )
 
     # Chart 1: SIP Portfolio Growth
     with st.container(
@@ -585,15 +638,7 @@ def render(data_loader):
         horizontal_alignment="distribute",
         vertical_alignment="center"
     ):
-        st.plotly_chart(
-            create_sip_portfolio_chart(
-                sip_table_df,
-                strategy_name_clean,
-                benchmark_name,
-                comparison_name_clean if comparison_returns is not None else None
-            ),
-            use_container_width=True
-        )
+        st.plotly_chart(sip_future.result(), use_container_width=True)
 
     # Chart 2: Cumulative Returns
     with st.container(
@@ -601,18 +646,7 @@ def render(data_loader):
         horizontal_alignment="distribute",
         vertical_alignment="center"
     ):
-        st.plotly_chart(
-            create_cumulative_returns_chart(
-                strategy_returns,
-                benchmark_returns,
-                strategy_name_clean,
-                benchmark_name,
-                comparison_returns,
-                comparison_name_clean if comparison_returns is not None else None,
-                log_scale
-            ),
-            use_container_width=True
-        )
+        st.plotly_chart(cumulative_future.result(), use_container_width=True)
 
     # Chart 3: Drawdown Comparison
     with st.container(
@@ -620,17 +654,7 @@ def render(data_loader):
         horizontal_alignment="distribute",
         vertical_alignment="center"
     ):
-        st.plotly_chart(
-            create_drawdown_comparison_chart(
-                strategy_returns,
-                benchmark_returns,
-                strategy_name_clean,
-                benchmark_name,
-                comparison_returns,
-                comparison_name_clean if comparison_returns is not None else None
-            ),
-            use_container_width=True
-        )
+        st.plotly_chart(drawdown_future.result(), use_container_width=True)
 
     # Chart 4: Annual Returns
     with st.container(
@@ -638,17 +662,7 @@ def render(data_loader):
         horizontal_alignment="distribute",
         vertical_alignment="center"
     ):
-        st.plotly_chart(
-            create_annual_returns_chart(
-                strategy_returns,
-                benchmark_returns,
-                strategy_name_clean,
-                benchmark_name,
-                comparison_returns,
-                comparison_name_clean if comparison_returns is not None else None
-            ),
-            use_container_width=True
-        )
+        st.plotly_chart(annual_future.result(), use_container_width=True)
 
     # === SECTION 2B: PERFORMANCE METRICS ===
     with st.container(
@@ -757,64 +771,55 @@ def render(data_loader):
 
         period_config = period_mapping[rolling_period_option]
 
+        # Build the four rolling figures concurrently (the rolling kernels
+        # release the GIL); the period radio has to render first since the
+        # window depends on it
+        rolling_kwargs = dict(
+            window=period_config["days"],
+            comparison_returns=comparison_returns,
+            comparison_name=comparison_name_clean if comparison_returns is not None else None
+        )
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            rolling_futures = [
+                pool.submit(
+                    _cached_chart, builder_name,
+                    strategy_returns, benchmark_returns,
+                    strategy_name_clean, benchmark_name,
+                    **rolling_kwargs
+                )
+                for builder_name in (
+                    'create_rolling_returns_chart',
+                    'create_rolling_volatility_chart',
+                    'create_rolling_beta_chart',
+                    'create_rolling_correlation_chart'
+                )
+            ]
+        rolling_returns_fig, rolling_vol_fig, rolling_beta_fig, rolling_corr_fig = [
+            f.result() for f in rolling_futures
+        ]
+
         # Display 2x2 grid of individual rolling charts
         # Row 1: Rolling Returns | Rolling Volatility
         row1_col1, row1_col2 = st.columns([1, 1])
 
         with row1_col1:
             with st.container(border=True, horizontal_alignment="distribute", vertical_alignment="center"):
-                st.plotly_chart(
-                    create_rolling_returns_chart(
-                        strategy_returns, benchmark_returns,
-                        strategy_name_clean, benchmark_name,
-                        window=period_config["days"],
-                        comparison_returns=comparison_returns,
-                        comparison_name=comparison_name_clean if comparison_returns is not None else None
-                    ),
-                    use_container_width=True
-                )
+                st.plotly_chart(rolling_returns_fig, use_container_width=True)
 
         with row1_col2:
             with st.container(border=True, horizontal_alignment="distribute", vertical_alignment="center"):
-                st.plotly_chart(
-                    create_rolling_volatility_chart(
-                        strategy_returns, benchmark_returns,
-                        strategy_name_clean, benchmark_name,
-                        window=period_config["days"],
-                        comparison_returns=comparison_returns,
-                        comparison_name=comparison_name_clean if comparison_returns is not None else None
-                    ),
-                    use_container_width=True
-                )
+                st.plotly_chart(rolling_vol_fig, use_container_width=True)
 
         # Row 2: Rolling Beta | Rolling Correlation
         row2_col1, row2_col2 = st.columns([1, 1])
 
         with row2_col1:
             with st.container(border=True, horizontal_alignment="distribute", vertical_alignment="center"):
-                st.plotly_chart(
-                    create_rolling_beta_chart(
-                        strategy_returns, benchmark_returns,
-                        strategy_name_clean, benchmark_name,
-                        window=period_config["days"],
-                        comparison_returns=comparison_returns,
-                        comparison_name=comparison_name_clean if comparison_returns is not None else None
-                    ),
-                    use_container_width=True
-                )
+                st.plotly_chart(rolling_beta_fig, use_container_width=True)
 
         with row2_col2:
             with st.container(border=True, horizontal_alignment="distribute", vertical_alignment="center"):
-                st.plotly_chart(
-                    create_rolling_correlation_chart(
-                        strategy_returns, benchmark_returns,
-                        strategy_name_clean, benchmark_name,
-                        window=period_config["days"],
-                        comparison_returns=comparison_returns,
-                        comparison_name=comparison_name_clean if comparison_returns is not None else None
-                    ),
-                    use_container_width=True
-                )
+                st.plotly_chart(rolling_corr_fig, use_container_width=True)
 
     # === SECTION 3: MONTHLY RETURNS ANALYSIS ===
     with st.container(border=True):
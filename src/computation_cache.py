@@ -108,7 +108,7 @@ def get_cached_annual_returns(fund_name, returns, start_date, end_date):
 
     # Calculate only if not in cache
     if cache_key not in st.session_state.annual_returns_cache:
-        annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1)
+        annual_returns = np.expm1(np.log1p(returns).resample('YE').sum())
         st.session_state.annual_returns_cache[cache_key] = annual_returns
 
     return st.session_state.annual_returns_cache[cache_key]
@@ -144,7 +144,7 @@ def get_cached_monthly_returns(fund_name, returns, start_date, end_date):
 
     # Calculate only if not in cache
     if cache_key not in st.session_state.monthly_returns_cache:
-        monthly_returns = returns.resample('ME').apply(lambda x: (1 + x).prod() - 1)
+        monthly_returns = np.expm1(np.log1p(returns).resample('ME').sum())
         st.session_state.monthly_returns_cache[cache_key] = monthly_returns
 
     return st.session_state.monthly_returns_cache[cache_key]
@@ -6,7 +6,7 @@ TRADING_DAYS = 252
 
 def calculate_cumulative_return(returns):
     """Calculate total cumulative return"""
-    return (1 + returns).prod() - 1
+    return np.expm1(np.log1p(returns).sum())
 
 def calculate_cagr(returns):
     """Calculate Compound Annual Growth Rate"""
@@ -35,10 +35,14 @@ def calculate_sortino_ratio(returns, risk_free_rate):
 
 def calculate_max_drawdown(returns):
     """Calculate maximum drawdown"""
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max
-    return drawdown.min()
+    if len(returns) == 0:
+        # Match the old pandas behaviour: NaN instead of a zero-size
+        # reduction error
+        return np.nan
+    # Scalar result, so stay in plain ufuncs — no pandas Series allocation
+    cumulative = np.cumprod(1.0 + returns.to_numpy())
+    running_max = np.maximum.accumulate(cumulative)
+    return ((cumulative - running_max) / running_max).min()
 
 def calculate_calmar_ratio(returns, risk_free_rate):
     """Calculate Calmar Ratio"""
@@ -56,7 +60,7 @@ def calculate_omega_ratio(returns, risk_free_rate):
 def calculate_drawdown_series(returns):
     """Calculate drawdown time series"""
     cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
+    running_max = cumulative.cummax()
     return (cumulative - running_max) / running_max
 
 def calculate_longest_drawdown(returns):
@@ -249,11 +253,11 @@ def create_sip_progression_table(strategy_returns, benchmark_returns,
     from scipy.optimize import newton
 
     # 1. Resample all returns to monthly frequency
-    strategy_monthly = strategy_returns.dropna().resample('ME').apply(lambda x: (1 + x).prod() - 1)
-    benchmark_monthly = benchmark_returns.dropna().resample('ME').apply(lambda x: (1 + x).prod() - 1)
+    strategy_monthly = np.expm1(np.log1p(strategy_returns.dropna()).resample('ME').sum())
+    benchmark_monthly = np.expm1(np.log1p(benchmark_returns.dropna()).resample('ME').sum())
 
     if comparison_returns is not None:
-        comparison_monthly = comparison_returns.dropna().resample('ME').apply(lambda x: (1 + x).prod() - 1)
+        comparison_monthly = np.expm1(np.log1p(comparison_returns.dropna()).resample('ME').sum())
     else:
         comparison_monthly = None
 
@@ -1,9 +1,332 @@
 import plotly.graph_objects as go
 import pandas as pd
 import numpy as np
+from functools import lru_cache
 from plotly.subplots import make_subplots
 from scipy import stats
 
+TRADING_DAYS = 252
+MONTHS_PER_YEAR = 12
+# Loop-invariant annualization factors, computed once at import
+SQRT_TRADING_DAYS = np.sqrt(TRADING_DAYS)
+SQRT_MONTHS_PER_YEAR = np.sqrt(MONTHS_PER_YEAR)
+
+# Shared month labels for the monthly heatmap and returns table
+MONTH_LABELS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun',
+                'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+@lru_cache(maxsize=4096)
+def _display_name(fund_name):
+    """Strip the scheme code from a "Name | Code" label, cached per name"""
+    return fund_name.split('|', 1)[0].strip() if '|' in fund_name else fund_name
+
+
+# Layout fragments shared by the standalone time-series charts. Plotly
+# copies values into each figure on update_layout, so the dicts are safe to
+# reuse; per-chart kwargs passed alongside override/extend them.
+_TIMESERIES_LAYOUT = dict(
+    xaxis_title="Date",
+    yaxis=dict(side='right'),
+    hovermode='x unified',
+    template='plotly_white',
+)
+_ROLLING_PANEL_LAYOUT = dict(
+    _TIMESERIES_LAYOUT,
+    height=400,
+    showlegend=False,
+    margin=dict(t=80, b=60, l=60, r=60),
+)
+
+# Compact layout shared by the five summary density strips on the
+# category page; only the title differs per chart
+_DENSITY_LAYOUT = dict(
+    height=140,
+    margin=dict(l=15, r=15, t=35, b=35),
+    template='plotly_white',
+    showlegend=False,
+    xaxis=dict(showticklabels=True, title='', showgrid=False),
+    yaxis=dict(showticklabels=False, title='', showgrid=False),
+    paper_bgcolor='rgba(0,0,0,0)',
+    plot_bgcolor='rgba(0,0,0,0)',
+)
+
+
+def _resample_to_monthly(returns):
+    """Resample daily returns to monthly compound returns"""
+    # Compound via a single Cython sum of log returns — one fused
+    # reduction per month, no per-group Python dispatch
+    return np.expm1(np.log1p(returns).resample('ME').sum())
+
+
+def _resample_to_annual(returns):
+    """Resample daily returns to annual compound returns"""
+    # Same fused log-sum compounding as the monthly helper, one bucket per year
+    return np.expm1(np.log1p(returns).resample('YE').sum())
+
+
+def _monthly_returns_grid(monthly_returns, dtype=np.float64):
+    """Scatter a monthly return series into a (years x 12) grid.
+
+    The monthly index is regular, so one advanced-indexing assignment
+    replaces a DataFrame pivot (hash-based reindexing). Returns the grid
+    and its year labels.
+    """
+    years = monthly_returns.index.year.values
+    months = monthly_returns.index.month.values
+    year_min = years.min()
+    grid = np.full((years.max() - year_min + 1, 12), np.nan, dtype=dtype)
+    grid[years - year_min, months - 1] = monthly_returns.values
+    return grid, np.arange(year_min, years.max() + 1)
+
+
+# Memo for _cumulative_growth: sibling charts in one dashboard render are
+# handed the same Series objects, so the growth curve only needs computing
+# once. Entries keep a reference to their input series, which prevents a
+# recycled id() from aliasing a dead key.
+_CUM_GROWTH_CACHE = {}
+
+
+def _cumulative_growth(returns):
+    """Memoized (1 + returns).cumprod() for chart builders"""
+    key = (id(returns), len(returns))
+    entry = _CUM_GROWTH_CACHE.get(key)
+    if entry is None or entry[0] is not returns:
+        if len(_CUM_GROWTH_CACHE) >= 16:
+            _CUM_GROWTH_CACHE.clear()
+        entry = (returns, (1 + returns).cumprod())
+        _CUM_GROWTH_CACHE[key] = entry
+    return entry[1]
+
+
+def _drawdown_pct(returns):
+    """Drawdown (%) series from daily returns
+
+    One C-level pass: cumprod + maximum.accumulate on the raw ndarray,
+    with the divide-and-subtract fused as cum / peak - 1. The cumprod is
+    pulled from the _cumulative_growth memo, so charts that draw both the
+    growth curve and the drawdown for one series pay for it once.
+    """
+    cum = _cumulative_growth(returns).to_numpy()
+    running_max = np.maximum.accumulate(cum)
+    # Only ever plotted at 2 decimal places, so ship float32 to Plotly
+    dd = ((cum / running_max - 1.0) * 100.0).astype(np.float32)
+    return pd.Series(dd, index=returns.index)
+
+
+def _rolling_compound_return(returns, window):
+    """Rolling compound return via a Cython rolling sum of log returns"""
+    return np.expm1(np.log1p(returns).rolling(window).sum())
+
+
+def _rolling_sum_pair(s, window):
+    """Rolling sum and sum-of-squares for one series"""
+    return s.rolling(window).sum(), (s * s).rolling(window).sum()
+
+
+def _calculate_rolling_metric(returns, metric_type, window_months, risk_free_rate=0.0249):
+    """Calculate rolling metric on monthly returns based on type"""
+    if metric_type == "Return":
+        # Annualized rolling return — compound via a rolling sum of log
+        # returns (Cython path) rather than a Python lambda per window
+        rolling_cum = np.expm1(np.log1p(returns).rolling(window_months).sum())
+        return rolling_cum * (MONTHS_PER_YEAR / window_months) * 100
+    elif metric_type == "Volatility":
+        # Annualized rolling volatility
+        return returns.rolling(window_months).std() * SQRT_MONTHS_PER_YEAR * 100
+    elif metric_type == "Sharpe":
+        # Rolling Sharpe ratio
+        rolling_mean = returns.rolling(window_months).mean() * MONTHS_PER_YEAR
+        rolling_std = returns.rolling(window_months).std() * SQRT_MONTHS_PER_YEAR
+        return (rolling_mean - risk_free_rate) / rolling_std
+    elif metric_type == "Drawdown":
+        # Rolling max drawdown (vectorized — the old per-step pandas
+        # loop was O(N·W) with heavy per-iteration overhead)
+        rolling_dd = _rolling_max_drawdown(returns.to_numpy(np.float64), window_months)
+        return pd.Series(rolling_dd, index=returns.index)
+    else:
+        raise ValueError(f"Unknown metric type: {metric_type}")
+
+def _monthly_returns_panel(returns_dict):
+    """Compound all funds' daily returns into one wide monthly DataFrame
+
+    Concatenating first means the category chart builders pay for a single
+    vectorized resample instead of one Python-level resample per fund.
+    Months before a fund's inception stay NaN (min_count=1).
+
+    Args:
+        returns_dict: Dictionary {fund_name: daily_returns_series}
+
+    Returns:
+        DataFrame indexed by month end with one column per fund
+    """
+    panel = pd.concat(returns_dict, axis=1)
+    return np.expm1(np.log1p(panel).resample('ME').sum(min_count=1))
+
+
+# Memoizes the annual panel so the bubble chart, per-year subplots and
+# annual table rendered on the same page resample the category only once.
+# Entries pin their input series to guard against id() recycling.
+_ANNUAL_PANEL_CACHE = {}
+
+
+def _annual_returns_panel(returns_dict):
+    """Compound all funds' daily returns into one wide annual DataFrame
+
+    Same single-pass concat-and-resample as _monthly_returns_panel, one
+    bucket per year. Years before a fund's inception stay NaN
+    (min_count=1).
+
+    Args:
+        returns_dict: Dictionary {fund_name: daily_returns_series}
+
+    Returns:
+        DataFrame indexed by year end with one column per fund
+    """
+    key = tuple(returns_dict) + tuple((id(s), len(s)) for s in returns_dict.values())
+    entry = _ANNUAL_PANEL_CACHE.get(key)
+    if entry is None or any(a is not b for a, b in zip(entry[0], returns_dict.values())):
+        if len(_ANNUAL_PANEL_CACHE) >= 8:
+            _ANNUAL_PANEL_CACHE.clear()
+        panel = pd.concat(returns_dict, axis=1)
+        entry = (tuple(returns_dict.values()),
+                 np.expm1(np.log1p(panel).resample('YE').sum(min_count=1)))
+        _ANNUAL_PANEL_CACHE[key] = entry
+    return entry[1]
+
+# Memoizes the fused per-year stats so the annual-return, volatility and
+# Sharpe distribution charts rendered back-to-back share one grouped pass.
+_ANNUAL_STATS_CACHE = {}
+
+
+def _annual_stats(returns_dict):
+    """Per-year mean, std, count and compound return for all funds at once
+
+    One concat plus one groupby over calendar years yields every panel the
+    distribution charts need, instead of each chart re-traversing the
+    DatetimeIndex per fund. Memoized like _annual_returns_panel, with
+    entries pinning their input series against id() recycling.
+
+    Args:
+        returns_dict: Dictionary {fund_name: daily_returns_series}
+
+    Returns:
+        Dict of year-indexed DataFrames: 'mean', 'std', 'count', 'compound'
+    """
+    key = tuple(returns_dict) + tuple((id(s), len(s)) for s in returns_dict.values())
+    entry = _ANNUAL_STATS_CACHE.get(key)
+    if entry is None or any(a is not b for a, b in zip(entry[0], returns_dict.values())):
+        if len(_ANNUAL_STATS_CACHE) >= 8:
+            _ANNUAL_STATS_CACHE.clear()
+        wide = pd.concat(returns_dict, axis=1)
+        grp = wide.groupby(wide.index.year)
+        panels = {
+            'mean': grp.mean(),
+            'std': grp.std(),
+            'count': grp.count(),
+            'compound': np.expm1(np.log1p(wide).groupby(wide.index.year).sum(min_count=1)),
+        }
+        entry = (tuple(returns_dict.values()), panels)
+        _ANNUAL_STATS_CACHE[key] = entry
+    return entry[1]
+
+def _kde_density(values, x_range):
+    """Gaussian KDE evaluated on a uniform grid, memoized on the inputs
+
+    scipy's gaussian_kde is O(N*M) over sample-grid pairs. For larger
+    samples, bin onto the grid and convolve with a Gaussian kernel at the
+    same Scott bandwidth instead — O(N + G*K) — which is indistinguishable
+    at plotting resolution. Small or degenerate samples keep the exact
+    scipy path. Results are cached on the sample bytes plus grid spec, so
+    re-renders with unchanged fund selections skip the KDE entirely.
+
+    Args:
+        values: 1-D array of samples, all within the span of x_range
+        x_range: Uniform ascending grid to evaluate the density on
+
+    Returns:
+        ndarray of density values aligned with x_range
+    """
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    return _kde_density_cached(values.tobytes(),
+                               float(x_range[0]), float(x_range[-1]), len(x_range))
+
+
+@lru_cache(maxsize=64)
+def _kde_density_cached(values_bytes, x_start, x_stop, n_grid):
+    values = np.frombuffer(values_bytes)
+    x_range = np.linspace(x_start, x_stop, n_grid)
+    n = len(values)
+    bandwidth = values.std(ddof=1) * n ** -0.2 if n > 1 else 0.0
+    if n < 200 or not np.isfinite(bandwidth) or bandwidth <= 0:
+        return stats.gaussian_kde(values)(x_range)
+    dx = x_range[1] - x_range[0]
+    edges = np.concatenate([x_range - dx / 2, [x_range[-1] + dx / 2]])
+    counts, _ = np.histogram(np.clip(values, x_range[0], x_range[-1]), bins=edges)
+    half_width = max(1, int(np.ceil(4 * bandwidth / dx)))
+    kernel = np.exp(-0.5 * (np.arange(-half_width, half_width + 1) * dx / bandwidth) ** 2)
+    kernel /= kernel.sum()
+    return np.convolve(counts, kernel, mode='same') / (n * dx)
+
+def _rolling_max_drawdown(returns_values, window):
+    """Rolling max drawdown (%) over trailing windows, fully vectorized
+
+    Works on the cumulative growth curve: drawdown is scale-invariant, so
+    each length-`window` slice of the cumulative product can be compared
+    against its own running maximum without rebasing. Uses a strided view
+    so no per-window Python loop or pandas object is created.
+    """
+    # Series shorter than the window have no complete trailing window —
+    # all-NaN output, same as the chart's skip behaviour for young funds
+    if returns_values.size <= window:
+        return np.full(returns_values.size, np.nan)
+    cum = np.cumprod(1.0 + returns_values)
+    windows = np.lib.stride_tricks.sliding_window_view(cum, window)
+    running_max = np.maximum.accumulate(windows, axis=1)
+    dd = ((windows - running_max) / running_max).min(axis=1) * 100.0
+
+    # Output at position i covers returns[i-window:i], matching the
+    # trailing-window convention used by the rolling charts
+    out = np.full(returns_values.size, np.nan)
+    out[window:] = dd[:-1]
+    return out
+
+
+def _downsample_for_display(series, max_points=2500):
+    """Thin very long display series with a uniform stride
+
+    A chart spans at most a couple of thousand horizontal pixels, so
+    shipping tens of thousands of daily points per trace only inflates the
+    figure JSON and slows the browser. Series at or under the cap are
+    returned untouched; longer ones keep every stride-th point plus the
+    final one so the curve still ends at its true value.
+    """
+    n = len(series)
+    if n <= max_points:
+        return series
+    stride = -(-n // max_points)
+    thinned = series.iloc[::stride]
+    if thinned.index[-1] != series.index[-1]:
+        thinned = pd.concat([thinned, series.iloc[[-1]]])
+    return thinned
+
+
+def _scatter_hover_text(dates, bench_pct, fund_pct, fund_label):
+    """Vectorized hover strings for the monthly returns scatter"""
+    date_part = np.char.add('Date: ', dates.strftime('%b %Y').to_numpy(str))
+    bench_part = np.char.mod('<br>Benchmark: %.2f%%', bench_pct)
+    fund_part = np.char.add('<br>' + fund_label + ': ', np.char.mod('%.2f%%', fund_pct))
+    return np.char.add(np.char.add(date_part, bench_part), fund_part)
+
+
+def _display_f32(values):
+    """Downcast display-only values to float32 before handing them to Plotly
+
+    Charts only ever render two decimal places, so float32 is plenty; it
+    halves the memory moved through the figure and the JSON payload sent
+    to the browser. Metric calculations stay in float64.
+    """
+    return values.astype(np.float32, copy=False)
+
 def create_cumulative_returns_chart(strategy_returns, benchmark_returns, strategy_name, benchmark_name,
                                     comparison_returns=None, comparison_name=None, log_scale=False):
     """Create cumulative returns comparison chart
@@ -20,18 +343,18 @@ def create_cumulative_returns_chart(strategy_returns, benchmark_returns, strateg
     Returns:
         Plotly Figure object
     """
-    strategy_cum = (1 + strategy_returns).cumprod() * 100
-    benchmark_cum = (1 + benchmark_returns).cumprod() * 100
+    strategy_cum = _downsample_for_display(_display_f32(_cumulative_growth(strategy_returns) * 100))
+    benchmark_cum = _downsample_for_display(_display_f32(_cumulative_growth(benchmark_returns) * 100))
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_cum.index,
         y=strategy_cum,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='₹%{y:.2f}<extra></extra>'
     ))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=benchmark_cum.index,
         y=benchmark_cum,
         name=benchmark_name,
@@ -41,8 +364,8 @@ def create_cumulative_returns_chart(strategy_returns, benchmark_returns, strateg
 
     # Add comparison fund if provided
     if comparison_returns is not None and comparison_name is not None:
-        comparison_cum = (1 + comparison_returns).cumprod() * 100
-        fig.add_trace(go.Scatter(
+        comparison_cum = _downsample_for_display(_display_f32(_cumulative_growth(comparison_returns) * 100))
+        fig.add_trace(go.Scattergl(
             x=comparison_cum.index,
             y=comparison_cum,
             name=comparison_name,
@@ -54,16 +377,14 @@ def create_cumulative_returns_chart(strategy_returns, benchmark_returns, strateg
     title_text = "Cumulative Returns" + (" (Log Scale)" if log_scale else "")
 
     fig.update_layout(
+        _TIMESERIES_LAYOUT,
         title=dict(text=title_text, font=dict(size=16)),
-        xaxis_title="Date",
         yaxis_title="Growth of ₹100",
         yaxis=dict(
             side='right',
             type='log' if log_scale else 'linear'
         ),
-        hovermode='x unified',
         height=500,
-        template='plotly_white',
         legend=dict(orientation="h", yanchor="top", y=1.1, xanchor="left", x=0),
         margin=dict(t=80, b=60, l=60, r=60)
     )
@@ -72,12 +393,10 @@ def create_cumulative_returns_chart(strategy_returns, benchmark_returns, strateg
 
 def create_drawdown_chart(returns, name):
     """Create drawdown chart"""
-    cumulative = (1 + returns).cumprod()
-    running_max = cumulative.expanding().max()
-    drawdown = (cumulative - running_max) / running_max * 100
+    drawdown = _drawdown_pct(returns)
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=drawdown.index,
         y=drawdown,
         fill='tozeroy',
@@ -88,13 +407,10 @@ def create_drawdown_chart(returns, name):
     ))
 
     fig.update_layout(
+        _TIMESERIES_LAYOUT,
         title=f"Drawdown - {name}",
-        xaxis_title="Date",
         yaxis_title="Drawdown (%)",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
-        height=300,
-        template='plotly_white'
+        height=300
     )
 
     return fig
@@ -102,20 +418,13 @@ def create_drawdown_chart(returns, name):
 def create_drawdown_comparison_chart(strategy_returns, benchmark_returns, strategy_name, benchmark_name,
                                      comparison_returns=None, comparison_name=None):
     """Create drawdown comparison chart for strategy vs benchmark"""
-    # Calculate strategy drawdown
-    strategy_cumulative = (1 + strategy_returns).cumprod()
-    strategy_running_max = strategy_cumulative.expanding().max()
-    strategy_drawdown = (strategy_cumulative - strategy_running_max) / strategy_running_max * 100
-
-    # Calculate benchmark drawdown
-    benchmark_cumulative = (1 + benchmark_returns).cumprod()
-    benchmark_running_max = benchmark_cumulative.expanding().max()
-    benchmark_drawdown = (benchmark_cumulative - benchmark_running_max) / benchmark_running_max * 100
+    strategy_drawdown = _drawdown_pct(strategy_returns)
+    benchmark_drawdown = _drawdown_pct(benchmark_returns)
 
     fig = go.Figure()
 
     # Add benchmark drawdown as area (drawn first, appears at bottom)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=benchmark_drawdown.index,
         y=benchmark_drawdown,
         name=benchmark_name,
@@ -127,11 +436,9 @@ def create_drawdown_comparison_chart(strategy_returns, benchmark_returns, strate
 
     # Add comparison fund drawdown if provided (drawn second)
     if comparison_returns is not None and comparison_name is not None:
-        comparison_cumulative = (1 + comparison_returns).cumprod()
-        comparison_running_max = comparison_cumulative.expanding().max()
-        comparison_drawdown = (comparison_cumulative - comparison_running_max) / comparison_running_max * 100
+        comparison_drawdown = _drawdown_pct(comparison_returns)
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=comparison_drawdown.index,
             y=comparison_drawdown,
             name=comparison_name,
@@ -142,7 +449,7 @@ def create_drawdown_comparison_chart(strategy_returns, benchmark_returns, strate
         ))
 
     # Add strategy drawdown as area (drawn last, appears on top)
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_drawdown.index,
         y=strategy_drawdown,
         name=strategy_name,
@@ -153,13 +460,10 @@ def create_drawdown_comparison_chart(strategy_returns, benchmark_returns, strate
     ))
 
     fig.update_layout(
+        _TIMESERIES_LAYOUT,
         title=dict(text="Drawdown Comparison", font=dict(size=16)),
-        xaxis_title="Date",
         yaxis_title="Drawdown (%)",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
         height=450,
-        template='plotly_white',
         legend=dict(orientation="h", yanchor="top", y=1.1, xanchor="left", x=0),
         margin=dict(t=80, b=60, l=60, r=60)
     )
@@ -168,23 +472,17 @@ def create_drawdown_comparison_chart(strategy_returns, benchmark_returns, strate
 
 def create_monthly_returns_heatmap(returns, name):
     """Create monthly returns heatmap"""
-    monthly_returns = returns.resample('M').apply(lambda x: (1 + x).prod() - 1) * 100
+    monthly_returns = _resample_to_monthly(returns) * 100
 
-    monthly_returns_df = pd.DataFrame({
-        'Year': monthly_returns.index.year,
-        'Month': monthly_returns.index.month,
-        'Return': monthly_returns.values
-    })
-
-    pivot = monthly_returns_df.pivot(index='Year', columns='Month', values='Return')
+    grid, year_labels = _monthly_returns_grid(monthly_returns, dtype=np.float32)
 
     fig = go.Figure(data=go.Heatmap(
-        z=pivot.values,
-        x=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec'],
-        y=pivot.index,
+        z=grid,
+        x=MONTH_LABELS,
+        y=year_labels,
         colorscale='RdYlGn',
         zmid=0,
-        text=np.round(pivot.values, 2),
+        text=np.round(grid, 2),
         texttemplate='%{text:.1f}',
         textfont={"size": 10},
         colorbar=dict(title="Return (%)")
@@ -203,34 +501,21 @@ def create_monthly_returns_heatmap(returns, name):
 def create_monthly_returns_table(returns):
     """Create monthly returns table with YTD column"""
     # Calculate monthly returns
-    monthly_returns = returns.resample('M').apply(lambda x: (1 + x).prod() - 1) * 100
+    monthly_returns = _resample_to_monthly(returns) * 100
 
-    # Create pivot table
-    monthly_returns_df = pd.DataFrame({
-        'Year': monthly_returns.index.year,
-        'Month': monthly_returns.index.month,
-        'Return': monthly_returns.values
-    })
+    # Grid first, DataFrame only at the end — avoids a pivot round-trip
+    grid, year_labels = _monthly_returns_grid(monthly_returns)
 
-    pivot = monthly_returns_df.pivot(index='Year', columns='Month', values='Return')
-
-    # Rename columns to month names
-    month_names = {1: 'Jan', 2: 'Feb', 3: 'Mar', 4: 'Apr', 5: 'May', 6: 'Jun',
-                   7: 'Jul', 8: 'Aug', 9: 'Sep', 10: 'Oct', 11: 'Nov', 12: 'Dec'}
-    pivot.columns = [month_names.get(col, col) for col in pivot.columns]
-
-    # Calculate YTD for each year
-    ytd_returns = []
-    for year in pivot.index:
-        year_data = monthly_returns[monthly_returns.index.year == year]
-        if len(year_data) > 0:
-            # YTD is compound return: (1 + r1) * (1 + r2) * ... - 1
-            ytd = ((1 + year_data / 100).prod() - 1) * 100
-            ytd_returns.append(ytd)
-        else:
-            ytd_returns.append(np.nan)
+    pivot = pd.DataFrame(
+        grid,
+        index=pd.Index(year_labels, name='Year'),
+        columns=MONTH_LABELS
+    )
 
-    pivot['YTD'] = ytd_returns
+    # YTD is the compound of each year's monthly returns — one C-level
+    # log-sum groupby instead of a boolean mask per year
+    ytd = np.expm1(np.log1p(monthly_returns / 100).groupby(monthly_returns.index.year).sum()) * 100
+    pivot['YTD'] = ytd.reindex(pivot.index)
 
     # Round to 2 decimal places
     pivot = pivot.round(2)
@@ -245,22 +530,26 @@ def create_monthly_returns_table(returns):
 
 def create_rolling_sharpe_chart(returns, benchmark_returns, strategy_name, benchmark_name, window=252, risk_free_rate=0.0249):
     """Create rolling Sharpe ratio chart"""
-    TRADING_DAYS = 252
+    # Mean and std are derived from one pair of rolling sums per series —
+    # half the rolling passes of separate .mean()/.std() calls
+    def fused_sharpe(r):
+        s, ss = _rolling_sum_pair(r, window)
+        mean = s / window
+        std = np.sqrt((ss - s * s / window) / (window - 1))
+        return _display_f32((mean * TRADING_DAYS - risk_free_rate) / (std * SQRT_TRADING_DAYS))
 
-    rolling_sharpe = (returns.rolling(window).mean() * TRADING_DAYS - risk_free_rate) / \
-                     (returns.rolling(window).std() * np.sqrt(TRADING_DAYS))
-    bench_rolling_sharpe = (benchmark_returns.rolling(window).mean() * TRADING_DAYS - risk_free_rate) / \
-                           (benchmark_returns.rolling(window).std() * np.sqrt(TRADING_DAYS))
+    rolling_sharpe = fused_sharpe(returns)
+    bench_rolling_sharpe = fused_sharpe(benchmark_returns)
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=rolling_sharpe.index,
         y=rolling_sharpe,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.2f}<extra></extra>'
     ))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=bench_rolling_sharpe.index,
         y=bench_rolling_sharpe,
         name=benchmark_name,
@@ -269,13 +558,10 @@ def create_rolling_sharpe_chart(returns, benchmark_returns, strategy_name, bench
     ))
 
     fig.update_layout(
+        _TIMESERIES_LAYOUT,
         title=f"Rolling Sharpe Ratio ({window} days)",
-        xaxis_title="Date",
         yaxis_title="Sharpe Ratio",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
         height=300,
-        template='plotly_white',
         legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
     )
 
@@ -284,18 +570,18 @@ def create_rolling_sharpe_chart(returns, benchmark_returns, strategy_name, bench
 def create_log_returns_chart(strategy_returns, benchmark_returns, strategy_name, benchmark_name,
                              comparison_returns=None, comparison_name=None):
     """Create log-scaled cumulative returns chart"""
-    strategy_cum = (1 + strategy_returns).cumprod()
-    benchmark_cum = (1 + benchmark_returns).cumprod()
+    strategy_cum = _downsample_for_display(_display_f32(_cumulative_growth(strategy_returns)))
+    benchmark_cum = _downsample_for_display(_display_f32(_cumulative_growth(benchmark_returns)))
 
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_cum.index,
         y=strategy_cum,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.2f}<extra></extra>'
     ))
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=benchmark_cum.index,
         y=benchmark_cum,
         name=benchmark_name,
@@ -305,8 +591,8 @@ def create_log_returns_chart(strategy_returns, benchmark_returns, strategy_name,
 
     # Add comparison fund if provided
     if comparison_returns is not None and comparison_name is not None:
-        comparison_cum = (1 + comparison_returns).cumprod()
-        fig.add_trace(go.Scatter(
+        comparison_cum = _downsample_for_display(_display_f32(_cumulative_growth(comparison_returns)))
+        fig.add_trace(go.Scattergl(
             x=comparison_cum.index,
             y=comparison_cum,
             name=comparison_name,
@@ -315,13 +601,11 @@ def create_log_returns_chart(strategy_returns, benchmark_returns, strategy_name,
         ))
 
     fig.update_layout(
+        _TIMESERIES_LAYOUT,
         title=dict(text="Cumulative Returns (Log Scale)", font=dict(size=18, weight='bold')),
-        xaxis_title="Date",
         yaxis_title="Growth of $1",
         yaxis=dict(type="log", side='right'),
-        hovermode='x unified',
         height=450,
-        template='plotly_white',
         legend=dict(orientation="h", yanchor="top", y=-0.2, xanchor="center", x=0.5),
         margin=dict(b=100)
     )
@@ -331,16 +615,14 @@ def create_log_returns_chart(strategy_returns, benchmark_returns, strategy_name,
 def create_rolling_returns_chart(strategy_returns, benchmark_returns, strategy_name, benchmark_name, window=252,
                                  comparison_returns=None, comparison_name=None):
     """Create rolling returns comparison chart"""
-    TRADING_DAYS = 252
-
     # Calculate rolling returns (annualized)
-    strategy_rolling = strategy_returns.rolling(window).apply(lambda x: (1 + x).prod() - 1) * (TRADING_DAYS / window) * 100
-    benchmark_rolling = benchmark_returns.rolling(window).apply(lambda x: (1 + x).prod() - 1) * (TRADING_DAYS / window) * 100
+    strategy_rolling = _display_f32(_rolling_compound_return(strategy_returns, window) * (TRADING_DAYS / window) * 100)
+    benchmark_rolling = _display_f32(_rolling_compound_return(benchmark_returns, window) * (TRADING_DAYS / window) * 100)
 
     fig = go.Figure()
 
     # Add strategy rolling returns
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_rolling.index,
         y=strategy_rolling,
         name=strategy_name,
@@ -349,7 +631,7 @@ def create_rolling_returns_chart(strategy_returns, benchmark_returns, strategy_n
     ))
 
     # Add benchmark rolling returns
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=benchmark_rolling.index,
         y=benchmark_rolling,
         name=benchmark_name,
@@ -359,8 +641,8 @@ def create_rolling_returns_chart(strategy_returns, benchmark_returns, strategy_n
 
     # Add comparison fund rolling returns if provided
     if comparison_returns is not None and comparison_name is not None:
-        comparison_rolling = comparison_returns.rolling(window).apply(lambda x: (1 + x).prod() - 1) * (TRADING_DAYS / window) * 100
-        fig.add_trace(go.Scatter(
+        comparison_rolling = _display_f32(_rolling_compound_return(comparison_returns, window) * (TRADING_DAYS / window) * 100)
+        fig.add_trace(go.Scattergl(
             x=comparison_rolling.index,
             y=comparison_rolling,
             name=comparison_name,
@@ -378,15 +660,9 @@ def create_rolling_returns_chart(strategy_returns, benchmark_returns, strategy_n
         period_label = "5 Years"
 
     fig.update_layout(
+        _ROLLING_PANEL_LAYOUT,
         title=dict(text=f"Rolling Returns ({period_label})", font=dict(size=16)),
-        xaxis_title="Date",
-        yaxis_title="Annualized Return (%)",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
-        height=400,
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(t=80, b=60, l=60, r=60)
+        yaxis_title="Annualized Return (%)"
     )
 
     return fig
@@ -394,17 +670,14 @@ def create_rolling_returns_chart(strategy_returns, benchmark_returns, strategy_n
 def create_rolling_volatility_chart(strategy_returns, benchmark_returns, strategy_name, benchmark_name, window=252,
                                     comparison_returns=None, comparison_name=None):
     """Create rolling volatility comparison chart"""
-    import numpy as np
-    TRADING_DAYS = 252
-
     # Calculate rolling volatility (annualized)
-    strategy_rolling_vol = strategy_returns.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
-    benchmark_rolling_vol = benchmark_returns.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
+    strategy_rolling_vol = strategy_returns.rolling(window).std() * SQRT_TRADING_DAYS * 100
+    benchmark_rolling_vol = benchmark_returns.rolling(window).std() * SQRT_TRADING_DAYS * 100
 
     fig = go.Figure()
 
     # Add strategy rolling volatility
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_rolling_vol.index,
         y=strategy_rolling_vol,
         name=strategy_name,
@@ -413,7 +686,7 @@ def create_rolling_volatility_chart(strategy_returns, benchmark_returns, strateg
     ))
 
     # Add benchmark rolling volatility
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=benchmark_rolling_vol.index,
         y=benchmark_rolling_vol,
         name=benchmark_name,
@@ -423,8 +696,8 @@ def create_rolling_volatility_chart(strategy_returns, benchmark_returns, strateg
 
     # Add comparison fund rolling volatility if provided
     if comparison_returns is not None and comparison_name is not None:
-        comparison_rolling_vol = comparison_returns.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
-        fig.add_trace(go.Scatter(
+        comparison_rolling_vol = comparison_returns.rolling(window).std() * SQRT_TRADING_DAYS * 100
+        fig.add_trace(go.Scattergl(
             x=comparison_rolling_vol.index,
             y=comparison_rolling_vol,
             name=comparison_name,
@@ -442,15 +715,9 @@ def create_rolling_volatility_chart(strategy_returns, benchmark_returns, strateg
         period_label = "5 Years"
 
     fig.update_layout(
+        _ROLLING_PANEL_LAYOUT,
         title=dict(text=f"Rolling Volatility ({period_label})", font=dict(size=16)),
-        xaxis_title="Date",
-        yaxis_title="Annualized Volatility (%)",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
-        height=400,
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(t=80, b=60, l=60, r=60)
+        yaxis_title="Annualized Volatility (%)"
     )
 
     return fig
@@ -469,7 +736,7 @@ def create_rolling_beta_chart(strategy_returns, benchmark_returns, strategy_name
     fig = go.Figure()
 
     # Add strategy rolling beta
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_rolling_beta.index,
         y=strategy_rolling_beta,
         name=strategy_name,
@@ -483,7 +750,7 @@ def create_rolling_beta_chart(strategy_returns, benchmark_returns, strategy_name
         comparison_rolling_cov = aligned_comparison.rolling(window).cov(aligned_benchmark)
         comparison_rolling_beta = comparison_rolling_cov / benchmark_rolling_var
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=comparison_rolling_beta.index,
             y=comparison_rolling_beta,
             name=comparison_name,
@@ -504,15 +771,9 @@ def create_rolling_beta_chart(strategy_returns, benchmark_returns, strategy_name
         period_label = "5 Years"
 
     fig.update_layout(
+        _ROLLING_PANEL_LAYOUT,
         title=dict(text=f"Rolling Beta ({period_label})", font=dict(size=16)),
-        xaxis_title="Date",
-        yaxis_title="Beta",
-        yaxis=dict(side='right'),
-        hovermode='x unified',
-        height=400,
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(t=80, b=60, l=60, r=60)
+        yaxis_title="Beta"
     )
 
     return fig
@@ -529,7 +790,7 @@ def create_rolling_correlation_chart(strategy_returns, benchmark_returns, strate
     fig = go.Figure()
 
     # Add strategy rolling correlation
-    fig.add_trace(go.Scatter(
+    fig.add_trace(go.Scattergl(
         x=strategy_rolling_corr.index,
         y=strategy_rolling_corr,
         name=strategy_name,
@@ -542,7 +803,7 @@ def create_rolling_correlation_chart(strategy_returns, benchmark_returns, strate
         aligned_comparison, _ = comparison_returns.align(benchmark_returns, join='inner')
         comparison_rolling_corr = aligned_comparison.rolling(window).corr(aligned_benchmark)
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=comparison_rolling_corr.index,
             y=comparison_rolling_corr,
             name=comparison_name,
@@ -553,7 +814,7 @@ def create_rolling_correlation_chart(strategy_returns, benchmark_returns, strate
         # Add strategy vs comparison fund correlation
         strategy_comp_corr = aligned_strategy.rolling(window).corr(aligned_comparison)
 
-        fig.add_trace(go.Scatter(
+        fig.add_trace(go.Scattergl(
             x=strategy_comp_corr.index,
             y=strategy_comp_corr,
             name=f"{strategy_name} vs {comparison_name}",
@@ -576,15 +837,10 @@ def create_rolling_correlation_chart(strategy_returns, benchmark_returns, strate
         period_label = "5 Years"
 
     fig.update_layout(
+        _ROLLING_PANEL_LAYOUT,
         title=dict(text=f"Rolling Correlation ({period_label})", font=dict(size=16)),
-        xaxis_title="Date",
         yaxis_title="Correlation",
-        yaxis=dict(side='right', range=[-1, 1], fixedrange=False),
-        hovermode='x unified',
-        height=400,
-        template='plotly_white',
-        showlegend=False,
-        margin=dict(t=80, b=60, l=60, r=60)
+        yaxis=dict(side='right', range=[-1, 1], fixedrange=False)
     )
 
     return fig
@@ -609,9 +865,6 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     Returns:
         Plotly figure with 2x2 subplots
     """
-    import numpy as np
-    TRADING_DAYS = 252
-
     # Align returns for beta and correlation calculations
     aligned_strategy, aligned_benchmark = strategy_returns.align(benchmark_returns, join='inner')
 
@@ -634,17 +887,14 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
         strategy_rolling_returns = aligned_strategy.ewm(span=ewm_span, min_periods=window).mean() * TRADING_DAYS * 100
         benchmark_rolling_returns = aligned_benchmark.ewm(span=ewm_span, min_periods=window).mean() * TRADING_DAYS * 100
     else:
-        strategy_rolling_returns = aligned_strategy.rolling(window).apply(
-            lambda x: (1 + x).prod() - 1
-        ) * (TRADING_DAYS / window) * 100
-        benchmark_rolling_returns = aligned_benchmark.rolling(window).apply(
-            lambda x: (1 + x).prod() - 1
-        ) * (TRADING_DAYS / window) * 100
+        strategy_rolling_returns = _rolling_compound_return(aligned_strategy, window) * (TRADING_DAYS / window) * 100
+        benchmark_rolling_returns = _rolling_compound_return(aligned_benchmark, window) * (TRADING_DAYS / window) * 100
 
     # Add strategy returns
+    strategy_rolling_returns = strategy_rolling_returns.dropna()
     fig.add_trace(go.Scatter(
-        x=strategy_rolling_returns.dropna().index,
-        y=strategy_rolling_returns.dropna(),
+        x=strategy_rolling_returns.index,
+        y=strategy_rolling_returns,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.2f}%<extra></extra>',
@@ -652,9 +902,10 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     ), row=1, col=1)
 
     # Add benchmark returns
+    benchmark_rolling_returns = benchmark_rolling_returns.dropna()
     fig.add_trace(go.Scatter(
-        x=benchmark_rolling_returns.dropna().index,
-        y=benchmark_rolling_returns.dropna(),
+        x=benchmark_rolling_returns.index,
+        y=benchmark_rolling_returns,
         name=benchmark_name,
         line=dict(color='#94A3B8', width=2, dash='dash'),
         hovertemplate='%{y:.2f}%<extra></extra>',
@@ -667,13 +918,12 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
         if use_ewm:
             comparison_rolling_returns = aligned_comparison.ewm(span=ewm_span, min_periods=window).mean() * TRADING_DAYS * 100
         else:
-            comparison_rolling_returns = aligned_comparison.rolling(window).apply(
-                lambda x: (1 + x).prod() - 1
-            ) * (TRADING_DAYS / window) * 100
+            comparison_rolling_returns = _rolling_compound_return(aligned_comparison, window) * (TRADING_DAYS / window) * 100
 
+        comparison_rolling_returns = comparison_rolling_returns.dropna()
         fig.add_trace(go.Scatter(
-            x=comparison_rolling_returns.dropna().index,
-            y=comparison_rolling_returns.dropna(),
+            x=comparison_rolling_returns.index,
+            y=comparison_rolling_returns,
             name=comparison_name,
             line=dict(color='#D4AF37', width=2),
             hovertemplate='%{y:.2f}%<extra></extra>',
@@ -684,16 +934,35 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
 
     # === CHART 2: ROLLING VOLATILITY (Row 1, Col 2) ===
     if use_ewm:
-        strategy_rolling_vol = aligned_strategy.ewm(span=ewm_span, min_periods=window).std() * np.sqrt(TRADING_DAYS) * 100
-        benchmark_rolling_vol = aligned_benchmark.ewm(span=ewm_span, min_periods=window).std() * np.sqrt(TRADING_DAYS) * 100
+        # One pairwise EWM covariance pass supplies the volatility, beta and
+        # correlation panels below — separate .std()/.cov()/.corr() calls
+        # would each rerun the recursive weighting over the same timeline
+        ewm_members = {'strategy': aligned_strategy, 'benchmark': aligned_benchmark}
+        if comparison_returns is not None and comparison_name is not None:
+            ewm_members['comparison'] = aligned_comparison
+        ewm_cov = pd.concat(ewm_members, axis=1).ewm(span=ewm_span, min_periods=window).cov(pairwise=True)
+        strategy_cov_row = ewm_cov.xs('strategy', level=1)
+        var_s = strategy_cov_row['strategy']
+        var_b = ewm_cov.xs('benchmark', level=1)['benchmark']
+        strategy_rolling_vol = np.sqrt(var_s) * SQRT_TRADING_DAYS * 100
+        benchmark_rolling_vol = np.sqrt(var_b) * SQRT_TRADING_DAYS * 100
     else:
-        strategy_rolling_vol = aligned_strategy.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
-        benchmark_rolling_vol = aligned_benchmark.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
+        # Rolling sums feed the volatility panel here and the beta /
+        # correlation panels below — one pass per series instead of
+        # separate std/cov/corr rolling engines
+        denom = window - 1
+        sum_s, sumsq_s = _rolling_sum_pair(aligned_strategy, window)
+        sum_b, sumsq_b = _rolling_sum_pair(aligned_benchmark, window)
+        var_s = (sumsq_s - sum_s * sum_s / window) / denom
+        var_b = (sumsq_b - sum_b * sum_b / window) / denom
+        strategy_rolling_vol = np.sqrt(var_s) * SQRT_TRADING_DAYS * 100
+        benchmark_rolling_vol = np.sqrt(var_b) * SQRT_TRADING_DAYS * 100
 
     # Add strategy volatility
+    strategy_rolling_vol = strategy_rolling_vol.dropna()
     fig.add_trace(go.Scatter(
-        x=strategy_rolling_vol.dropna().index,
-        y=strategy_rolling_vol.dropna(),
+        x=strategy_rolling_vol.index,
+        y=strategy_rolling_vol,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.2f}%<extra></extra>',
@@ -701,9 +970,10 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     ), row=1, col=2)
 
     # Add benchmark volatility
+    benchmark_rolling_vol = benchmark_rolling_vol.dropna()
     fig.add_trace(go.Scatter(
-        x=benchmark_rolling_vol.dropna().index,
-        y=benchmark_rolling_vol.dropna(),
+        x=benchmark_rolling_vol.index,
+        y=benchmark_rolling_vol,
         name=benchmark_name,
         line=dict(color='#94A3B8', width=2, dash='dash'),
         hovertemplate='%{y:.2f}%<extra></extra>',
@@ -713,13 +983,17 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     # Add comparison volatility if provided
     if comparison_returns is not None and comparison_name is not None:
         if use_ewm:
-            comparison_rolling_vol = aligned_comparison.ewm(span=ewm_span, min_periods=window).std() * np.sqrt(TRADING_DAYS) * 100
+            var_c = ewm_cov.xs('comparison', level=1)['comparison']
+            comparison_rolling_vol = np.sqrt(var_c) * SQRT_TRADING_DAYS * 100
         else:
-            comparison_rolling_vol = aligned_comparison.rolling(window).std() * np.sqrt(TRADING_DAYS) * 100
+            sum_c, sumsq_c = _rolling_sum_pair(aligned_comparison, window)
+            var_c = (sumsq_c - sum_c * sum_c / window) / denom
+            comparison_rolling_vol = np.sqrt(var_c) * SQRT_TRADING_DAYS * 100
 
+        comparison_rolling_vol = comparison_rolling_vol.dropna()
         fig.add_trace(go.Scatter(
-            x=comparison_rolling_vol.dropna().index,
-            y=comparison_rolling_vol.dropna(),
+            x=comparison_rolling_vol.index,
+            y=comparison_rolling_vol,
             name=comparison_name,
             line=dict(color='#D4AF37', width=2),
             hovertemplate='%{y:.2f}%<extra></extra>',
@@ -730,18 +1004,24 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
 
     # === CHART 3: ROLLING BETA (Row 2, Col 1) ===
     if use_ewm:
-        strategy_rolling_cov = aligned_strategy.ewm(span=ewm_span, min_periods=window).cov(aligned_benchmark)
-        benchmark_rolling_var = aligned_benchmark.ewm(span=ewm_span, min_periods=window).var()
+        benchmark_rolling_var = var_b
+        strategy_rolling_cov = strategy_cov_row['benchmark']
         strategy_rolling_beta = strategy_rolling_cov / benchmark_rolling_var
+        strategy_rolling_corr = strategy_rolling_cov / np.sqrt(var_s * benchmark_rolling_var)
     else:
-        strategy_rolling_cov = aligned_strategy.rolling(window).cov(aligned_benchmark)
-        benchmark_rolling_var = aligned_benchmark.rolling(window).var()
+        # Per-series moments were computed in the volatility panel above;
+        # only the cross-product sum is new here
+        benchmark_rolling_var = var_b
+        sum_sb = (aligned_strategy * aligned_benchmark).rolling(window).sum()
+        strategy_rolling_cov = (sum_sb - sum_s * sum_b / window) / denom
         strategy_rolling_beta = strategy_rolling_cov / benchmark_rolling_var
+        strategy_rolling_corr = strategy_rolling_cov / np.sqrt(var_s * benchmark_rolling_var)
 
     # Add strategy beta
+    strategy_rolling_beta = strategy_rolling_beta.dropna()
     fig.add_trace(go.Scatter(
-        x=strategy_rolling_beta.dropna().index,
-        y=strategy_rolling_beta.dropna(),
+        x=strategy_rolling_beta.index,
+        y=strategy_rolling_beta,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.2f}<extra></extra>',
@@ -751,15 +1031,19 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     # Add comparison beta if provided
     if comparison_returns is not None and comparison_name is not None:
         if use_ewm:
-            comparison_rolling_cov = aligned_comparison.ewm(span=ewm_span, min_periods=window).cov(aligned_benchmark)
+            comparison_rolling_cov = ewm_cov.xs('comparison', level=1)['benchmark']
             comparison_rolling_beta = comparison_rolling_cov / benchmark_rolling_var
+            comparison_rolling_corr = comparison_rolling_cov / np.sqrt(var_c * benchmark_rolling_var)
         else:
-            comparison_rolling_cov = aligned_comparison.rolling(window).cov(aligned_benchmark)
+            sum_cb = (aligned_comparison * aligned_benchmark).rolling(window).sum()
+            comparison_rolling_cov = (sum_cb - sum_c * sum_b / window) / denom
             comparison_rolling_beta = comparison_rolling_cov / benchmark_rolling_var
+            comparison_rolling_corr = comparison_rolling_cov / np.sqrt(var_c * benchmark_rolling_var)
 
+        comparison_rolling_beta = comparison_rolling_beta.dropna()
         fig.add_trace(go.Scatter(
-            x=comparison_rolling_beta.dropna().index,
-            y=comparison_rolling_beta.dropna(),
+            x=comparison_rolling_beta.index,
+            y=comparison_rolling_beta,
             name=comparison_name,
             line=dict(color='#D4AF37', width=2),
             hovertemplate='%{y:.2f}<extra></extra>',
@@ -772,15 +1056,13 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
     fig.update_yaxes(title_text="Beta", row=2, col=1)
 
     # === CHART 4: ROLLING CORRELATION (Row 2, Col 2) ===
-    if use_ewm:
-        strategy_rolling_corr = aligned_strategy.ewm(span=ewm_span, min_periods=window).corr(aligned_benchmark)
-    else:
-        strategy_rolling_corr = aligned_strategy.rolling(window).corr(aligned_benchmark)
+    # (correlations were derived from the shared moments in the beta sweep above)
 
     # Add strategy correlation
+    strategy_rolling_corr = strategy_rolling_corr.dropna()
     fig.add_trace(go.Scatter(
-        x=strategy_rolling_corr.dropna().index,
-        y=strategy_rolling_corr.dropna(),
+        x=strategy_rolling_corr.index,
+        y=strategy_rolling_corr,
         name=strategy_name,
         line=dict(color='#1E3A5F', width=2),
         hovertemplate='%{y:.3f}<extra></extra>',
@@ -789,14 +1071,10 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
 
     # Add comparison correlation if provided
     if comparison_returns is not None and comparison_name is not None:
-        if use_ewm:
-            comparison_rolling_corr = aligned_comparison.ewm(span=ewm_span, min_periods=window).corr(aligned_benchmark)
-        else:
-            comparison_rolling_corr = aligned_comparison.rolling(window).corr(aligned_benchmark)
-
+        comparison_rolling_corr = comparison_rolling_corr.dropna()
         fig.add_trace(go.Scatter(
-            x=comparison_rolling_corr.dropna().index,
-            y=comparison_rolling_corr.dropna(),
+            x=comparison_rolling_corr.index,
+            y=comparison_rolling_corr,
             name=comparison_name,
             line=dict(color='#D4AF37', width=2),
             hovertemplate='%{y:.3f}<extra></extra>',
@@ -805,13 +1083,17 @@ def create_rolling_analysis_subplot(strategy_returns, benchmark_returns, strateg
 
         # Add strategy vs comparison fund correlation
         if use_ewm:
-            strategy_comp_corr = aligned_strategy.ewm(span=ewm_span, min_periods=window).corr(aligned_comparison)
+            cov_sc = strategy_cov_row['comparison']
+            strategy_comp_corr = cov_sc / np.sqrt(var_s * var_c)
         else:
-            strategy_comp_corr = aligned_strategy.rolling(window).corr(aligned_comparison)
+            sum_sc = (aligned_strategy * aligned_comparison).rolling(window).sum()
+            cov_sc = (sum_sc - sum_s * sum_c / window) / denom
+            strategy_comp_corr = cov_sc / np.sqrt(var_s * var_c)
 
+        strategy_comp_corr = strategy_comp_corr.dropna()
         fig.add_trace(go.Scatter(
-            x=strategy_comp_corr.dropna().index,
-            y=strategy_comp_corr.dropna(),
+            x=strategy_comp_corr.index,
+            y=strategy_comp_corr,
             name=f"{strategy_name} vs {comparison_name}",
             line=dict(color='#8b5cf6', width=2, dash='dot'),
             hovertemplate='%{y:.3f}<extra></extra>',
@@ -844,21 +1126,35 @@ def create_annual_returns_chart(strategy_returns, benchmark_returns, strategy_na
     """Create annual returns bar chart with data labels"""
 
     # Calculate annual returns
-    strategy_annual = strategy_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_annual = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-
-    # Align both series to ensure they have the same years
-    strategy_annual, benchmark_annual = strategy_annual.align(benchmark_annual, join='outer', fill_value=0)
+    strategy_annual = _resample_to_annual(strategy_returns) * 100
+    benchmark_annual = _resample_to_annual(benchmark_returns) * 100
 
-    # If comparison fund is provided, add it to alignment
+    # Put every series on one union of years — a single index merge and
+    # one reindex per series instead of cascading pairwise aligns
     if comparison_returns is not None:
-        comparison_annual = comparison_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-        strategy_annual, comparison_annual = strategy_annual.align(comparison_annual, join='outer', fill_value=0)
-        benchmark_annual, comparison_annual = benchmark_annual.align(comparison_annual, join='outer', fill_value=0)
+        comparison_annual = _resample_to_annual(comparison_returns) * 100
+        year_index = strategy_annual.index.union(benchmark_annual.index).union(comparison_annual.index)
+        comparison_annual = comparison_annual.reindex(year_index, fill_value=0)
+    else:
+        year_index = strategy_annual.index.union(benchmark_annual.index)
+    strategy_annual = strategy_annual.reindex(year_index, fill_value=0)
+    benchmark_annual = benchmark_annual.reindex(year_index, fill_value=0)
 
     # Extract years
     years = strategy_annual.index.year
 
+    # Per-bar text labels are expensive to render for wide year ranges;
+    # skip them beyond 20 years and rely on hover instead
+    show_labels = len(years) <= 20
+
+    def bar_labels(values):
+        """Vectorized '%'-suffixed labels (None when labels are disabled)"""
+        if not show_labels:
+            return None
+        return np.char.add(np.round(values, 1).astype(str), '%')
+
+    text_position = 'outside' if show_labels else 'none'
+
     fig = go.Figure()
 
     # Add strategy bars with labels
@@ -868,8 +1164,8 @@ def create_annual_returns_chart(strategy_returns, benchmark_returns, strategy_na
             y=strategy_annual.values,
             name=strategy_name,
             marker=dict(color='rgba(30, 58, 95, 0.8)', line=dict(width=0)),
-            text=[f"{v:.0f}%" for v in strategy_annual.values],
-            textposition='outside',
+            text=bar_labels(strategy_annual.values),
+            textposition=text_position,
             textfont=dict(size=14, color='#1F2937'),
             hovertemplate='%{y:.2f}%<extra></extra>'
         )
@@ -882,8 +1178,8 @@ def create_annual_returns_chart(strategy_returns, benchmark_returns, strategy_na
             y=benchmark_annual.values,
             name=benchmark_name,
             marker=dict(color='rgba(148, 163, 184, 0.7)', line=dict(width=0)),
-            text=[f"{v:.0f}%" for v in benchmark_annual.values],
-            textposition='outside',
+            text=bar_labels(benchmark_annual.values),
+            textposition=text_position,
             textfont=dict(size=14, color='#1F2937'),
             hovertemplate='%{y:.2f}%<extra></extra>'
         )
@@ -897,8 +1193,8 @@ def create_annual_returns_chart(strategy_returns, benchmark_returns, strategy_na
                 y=comparison_annual.values,
                 name=comparison_name,
                 marker=dict(color='rgba(212, 175, 55, 0.8)', line=dict(width=0)),
-                text=[f"{v:.0f}%" for v in comparison_annual.values],
-                textposition='outside',
+                text=bar_labels(comparison_annual.values),
+                textposition=text_position,
                 textfont=dict(size=14, color='#1F2937'),
                 hovertemplate='%{y:.2f}%<extra></extra>'
             )
@@ -962,7 +1258,8 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
     if sip_table_df is not None:
         # Prepare SIP data (remove TOTAL and IRR rows)
         chart_df = sip_table_df.iloc[:-2].copy()
-        chart_df['Date'] = pd.to_datetime(chart_df['Period'] + '-01')
+        # Fixed-format parse takes the fast path and skips the '-01' string concat
+        chart_df['Date'] = pd.to_datetime(chart_df['Period'], format='%Y-%m')
 
         # Add Amount Invested (reference line)
         fig.add_trace(go.Scatter(
@@ -1065,8 +1362,10 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
     annual_row = 4 if sip_table_df is not None else 3
 
     # === CUMULATIVE RETURNS ===
-    strategy_cum = (1 + strategy_returns).cumprod() * 100
-    benchmark_cum = (1 + benchmark_returns).cumprod() * 100
+    # Thin the display series so the browser payload stays bounded for long
+    # histories; drawdown stays full-resolution so troughs are never skipped
+    strategy_cum = _downsample_for_display(_display_f32(_cumulative_growth(strategy_returns) * 100))
+    benchmark_cum = _downsample_for_display(_display_f32(_cumulative_growth(benchmark_returns) * 100))
 
     if log_scale:
         # Log scale: show growth of ₹100
@@ -1089,7 +1388,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
         ), row=cumulative_row, col=1)
 
         if comparison_returns is not None and comparison_name is not None:
-            comparison_cum = (1 + comparison_returns).cumprod() * 100
+            comparison_cum = _downsample_for_display(_display_f32(_cumulative_growth(comparison_returns) * 100))
             fig.add_trace(go.Scatter(
                 x=comparison_cum.index,
                 y=comparison_cum,
@@ -1121,7 +1420,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
         ), row=cumulative_row, col=1)
 
         if comparison_returns is not None and comparison_name is not None:
-            comparison_cum = (1 + comparison_returns).cumprod() * 100
+            comparison_cum = _downsample_for_display(_display_f32(_cumulative_growth(comparison_returns) * 100))
             fig.add_trace(go.Scatter(
                 x=comparison_cum.index,
                 y=comparison_cum,
@@ -1134,15 +1433,8 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
         fig.update_yaxes(title_text="Growth of ₹100", row=cumulative_row, col=1)
 
     # === DRAWDOWN ===
-    # Calculate strategy drawdown
-    strategy_cumulative = (1 + strategy_returns).cumprod()
-    strategy_running_max = strategy_cumulative.expanding().max()
-    strategy_drawdown = (strategy_cumulative - strategy_running_max) / strategy_running_max * 100
-
-    # Calculate benchmark drawdown
-    benchmark_cumulative = (1 + benchmark_returns).cumprod()
-    benchmark_running_max = benchmark_cumulative.expanding().max()
-    benchmark_drawdown = (benchmark_cumulative - benchmark_running_max) / benchmark_running_max * 100
+    strategy_drawdown = _drawdown_pct(strategy_returns)
+    benchmark_drawdown = _drawdown_pct(benchmark_returns)
 
     fig.add_trace(go.Scatter(
         x=strategy_drawdown.index,
@@ -1167,9 +1459,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
     ), row=drawdown_row, col=1)
 
     if comparison_returns is not None and comparison_name is not None:
-        comparison_cumulative = (1 + comparison_returns).cumprod()
-        comparison_running_max = comparison_cumulative.expanding().max()
-        comparison_drawdown = (comparison_cumulative - comparison_running_max) / comparison_running_max * 100
+        comparison_drawdown = _drawdown_pct(comparison_returns)
 
         fig.add_trace(go.Scatter(
             x=comparison_drawdown.index,
@@ -1186,17 +1476,19 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
 
     # === ANNUAL RETURNS ===
     # Calculate annual returns
-    strategy_annual = strategy_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_annual = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-
-    # Align both series to ensure they have the same years
-    strategy_annual, benchmark_annual = strategy_annual.align(benchmark_annual, join='outer', fill_value=0)
+    strategy_annual = _resample_to_annual(strategy_returns) * 100
+    benchmark_annual = _resample_to_annual(benchmark_returns) * 100
 
-    # If comparison fund is provided, add it to alignment
+    # Put every series on one union of years — a single index merge and
+    # one reindex per series instead of cascading pairwise aligns
     if comparison_returns is not None:
-        comparison_annual = comparison_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-        strategy_annual, comparison_annual = strategy_annual.align(comparison_annual, join='outer', fill_value=0)
-        benchmark_annual, comparison_annual = benchmark_annual.align(comparison_annual, join='outer', fill_value=0)
+        comparison_annual = _resample_to_annual(comparison_returns) * 100
+        year_index = strategy_annual.index.union(benchmark_annual.index).union(comparison_annual.index)
+        comparison_annual = comparison_annual.reindex(year_index, fill_value=0)
+    else:
+        year_index = strategy_annual.index.union(benchmark_annual.index)
+    strategy_annual = strategy_annual.reindex(year_index, fill_value=0)
+    benchmark_annual = benchmark_annual.reindex(year_index, fill_value=0)
 
     # Extract years
     years = strategy_annual.index.year
@@ -1208,7 +1500,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
             y=strategy_annual.values,
             name=strategy_name,
             marker=dict(color='rgba(30, 58, 95, 0.8)', line=dict(width=0)),
-            text=[f"{v:.0f}%" for v in strategy_annual.values],
+            text=np.char.mod('%.0f%%', strategy_annual.values),
             textposition='outside',
             textfont=dict(size=11, color='#1F2937'),
             hovertemplate='%{y:.2f}%<extra></extra>',
@@ -1223,7 +1515,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
             y=benchmark_annual.values,
             name=benchmark_name,
             marker=dict(color='rgba(148, 163, 184, 0.7)', line=dict(width=0)),
-            text=[f"{v:.0f}%" for v in benchmark_annual.values],
+            text=np.char.mod('%.0f%%', benchmark_annual.values),
             textposition='outside',
             textfont=dict(size=11, color='#1F2937'),
             hovertemplate='%{y:.2f}%<extra></extra>',
@@ -1239,7 +1531,7 @@ def create_performance_overview_subplot(strategy_returns, benchmark_returns, str
                 y=comparison_annual.values,
                 name=comparison_name,
                 marker=dict(color='rgba(212, 175, 55, 0.8)', line=dict(width=0)),
-                text=[f"{v:.0f}%" for v in comparison_annual.values],
+                text=np.char.mod('%.0f%%', comparison_annual.values),
                 textposition='outside',
                 textfont=dict(size=11, color='#1F2937'),
                 hovertemplate='%{y:.2f}%<extra></extra>',
@@ -1278,40 +1570,54 @@ def create_category_equity_curves(returns_dict, benchmark_returns, benchmark_nam
     Returns:
         Plotly figure
     """
-    fig = go.Figure()
-
     # Color palette for funds
     colors = [
         '#1E3A5F', '#ef4444', '#D4AF37', '#8b5cf6', '#ec4899',
         '#06b6d4', '#f97316', '#84cc16', '#6366f1', '#14b8a6'
     ]
 
-    def resample_to_monthly(returns):
-        """Resample daily returns to monthly returns"""
-        # Use 'ME' (Month End) frequency and calculate compound return for each month
-        return returns.resample('ME').apply(lambda x: (1 + x).prod() - 1)
-
     def calculate_cagr(cum_returns, start_date, end_dates):
-        """Calculate CAGR for each point in the series"""
-        cagrs = []
-        for i, end_date in enumerate(end_dates):
-            years = (end_date - start_date).days / 365.25
-            if years > 0:
-                cagr = ((cum_returns.iloc[i]) ** (1 / years) - 1) * 100
-                cagrs.append(cagr)
-            else:
-                cagrs.append(0)
-        return cagrs
+        """Calculate CAGR for each point in the series (vectorized)"""
+        # One numpy power call over the whole curve instead of a Python
+        # loop with per-point iloc and timedelta arithmetic
+        days = (end_dates - start_date).days.values
+        # inf for the zero-day start point makes the exponent 0, so the
+        # power stays finite before the where() masks it to 0
+        years = np.where(days > 0, days / 365.25, np.inf)
+        return np.where(days > 0, (cum_returns.values ** (1 / years) - 1) * 100, 0.0)
 
     # Grayscale color for unselected funds
     grayscale_color = '#999999'
 
+    # Resample all funds to monthly in one pass
+    monthly_panel = _monthly_returns_panel(returns_dict)
+
+    # One column-wise cumprod over the whole panel instead of a cumprod per
+    # fund: a single pass over memory, and NaN padding from the alignment
+    # is skipped so each column matches its own dropna'd cumprod
+    cum_panel = (1 + monthly_panel).cumprod()
+
+    # Point-in-time CAGR for every fund in one broadcast over the panel:
+    # elapsed days per row minus each fund's inception offset, then a
+    # single matrix power — replaces one vector call per fund
+    day_arr = (cum_panel.index - cum_panel.index[0]).days.to_numpy()
+    first_valid_pos = cum_panel.notna().to_numpy().argmax(axis=0)
+    days_mat = day_arr[:, None] - day_arr[first_valid_pos][None, :]
+    years_mat = np.where(days_mat > 0, days_mat / 365.25, np.inf)
+    cagr_panel = pd.DataFrame(
+        np.where(days_mat > 0, (cum_panel.to_numpy() ** (1 / years_mat) - 1) * 100, 0.0),
+        index=cum_panel.index, columns=cum_panel.columns
+    )
+
+    # Collect traces and hand them to the figure in one go — add_trace
+    # revalidates the whole figure on every call, which adds up per fund
+    traces = []
+
     # Add each fund's equity curve
-    for idx, (fund_name, returns) in enumerate(returns_dict.items()):
-        # Resample to monthly
-        monthly_returns = resample_to_monthly(returns)
-        # Calculate cumulative returns on monthly data
-        cum_returns = (1 + monthly_returns).cumprod()
+    for idx, fund_name in enumerate(returns_dict):
+        # Cap points per trace; monthly curves only exceed this for very
+        # long histories, but the figure carries one trace per fund
+        cum_returns = _downsample_for_display(cum_panel[fund_name].dropna())
 
         # Determine styling based on selection
         if selected_funds is None:
@@ -1330,18 +1636,15 @@ def create_category_equity_curves(returns_dict, benchmark_returns, benchmark_nam
             opacity = 0.3  # More transparent
             width = 1.0    # Thinner
 
-        # Calculate growth of 100
-        growth_values = cum_returns * 100
+        # Calculate growth of 100 — raw ndarrays let Plotly take its
+        # typed-array serialization fast path
+        growth_values = _display_f32((cum_returns * 100).to_numpy())
 
-        # Calculate CAGR for each point
-        start_date = cum_returns.index[0]
-        cagrs = calculate_cagr(cum_returns, start_date, cum_returns.index)
+        # Hover CAGR from the precomputed panel, aligned to the thinned index
+        customdata = cagr_panel[fund_name].loc[cum_returns.index].to_numpy().reshape(-1, 1)
 
-        # Create custom hover text with both growth and CAGR
-        customdata = list(zip(cagrs))
-
-        fig.add_trace(go.Scatter(
-            x=cum_returns.index,
+        traces.append(go.Scatter(
+            x=cum_returns.index.values,
             y=growth_values,
             name=fund_name,
             line=dict(color=color, width=width),
@@ -1351,17 +1654,17 @@ def create_category_equity_curves(returns_dict, benchmark_returns, benchmark_nam
         ))
 
     # Add benchmark (thicker, distinct line)
-    monthly_benchmark = resample_to_monthly(benchmark_returns)
-    benchmark_cum = (1 + monthly_benchmark).cumprod()
-    benchmark_growth = benchmark_cum * 100
+    monthly_benchmark = _resample_to_monthly(benchmark_returns)
+    benchmark_cum = _downsample_for_display((1 + monthly_benchmark).cumprod())
+    benchmark_growth = _display_f32((benchmark_cum * 100).to_numpy())
 
     # Calculate benchmark CAGR
     start_date = benchmark_cum.index[0]
     benchmark_cagrs = calculate_cagr(benchmark_cum, start_date, benchmark_cum.index)
-    customdata_bench = list(zip(benchmark_cagrs))
+    customdata_bench = benchmark_cagrs.reshape(-1, 1)
 
-    fig.add_trace(go.Scatter(
-        x=benchmark_cum.index,
+    traces.append(go.Scatter(
+        x=benchmark_cum.index.values,
         y=benchmark_growth,
         name=f"🔷 {benchmark_name}",
         line=dict(color='#94A3B8', width=3, dash='dash'),
@@ -1369,6 +1672,8 @@ def create_category_equity_curves(returns_dict, benchmark_returns, benchmark_nam
         hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Value: ₹%{y:.2f}<br>CAGR: %{customdata[0]:.2f}%<extra></extra>'
     ))
 
+    fig = go.Figure(data=traces)
+
     fig.update_layout(
         title=dict(text="Category Equity Curves - Growth of ₹100", font=dict(size=18, weight='bold')),
         xaxis_title="Date",
@@ -1396,45 +1701,53 @@ def create_annual_returns_bubble_chart(returns_dict, benchmark_returns, benchmar
     Returns:
         Plotly figure
     """
-    # Calculate annual returns and volatility for each fund
-    all_data = []
+    # One resample pass for the whole category, shared with the other
+    # annual views through the memoized panel; volatilities come from the
+    # fused per-year stats panel instead of a resample per fund
+    annual_panel = _annual_returns_panel(returns_dict) * 100
+    vol_panel = _annual_stats(returns_dict)['std'] * SQRT_TRADING_DAYS * 100
+
+    # Build the fund-year table column-wise: arrays per fund and a single
+    # concatenate at the end, instead of one Python dict per cell going
+    # through the slow records-to-DataFrame inference path
+    fund_col, type_col = [], []
+    year_cols, ret_cols, vol_cols = [], [], []
 
     # Process each fund
-    for fund_name, returns in returns_dict.items():
-        # Calculate annual returns
-        annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-
-        # Calculate annual volatility
-        annual_volatility = returns.resample('YE').std() * np.sqrt(252) * 100
+    for fund_name in returns_dict:
+        annual_returns = annual_panel[fund_name].dropna()
+        years_arr = annual_returns.index.year.to_numpy()
 
-        for year in annual_returns.index:
-            all_data.append({
-                'Fund': fund_name,
-                'Year': year.year,
-                'Annual Return': annual_returns[year],
-                'Annual Volatility': annual_volatility[year],
-                'Type': 'Fund'
-            })
+        fund_col.extend([fund_name] * len(annual_returns))
+        type_col.extend(['Fund'] * len(annual_returns))
+        year_cols.append(years_arr)
+        ret_cols.append(annual_returns.to_numpy())
+        vol_cols.append(vol_panel[fund_name].reindex(years_arr).to_numpy())
 
     # Add benchmark data
-    benchmark_annual_returns = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_annual_volatility = benchmark_returns.resample('YE').std() * np.sqrt(252) * 100
-
-    for year in benchmark_annual_returns.index:
-        all_data.append({
-            'Fund': f"🔷 {benchmark_name}",
-            'Year': year.year,
-            'Annual Return': benchmark_annual_returns[year],
-            'Annual Volatility': benchmark_annual_volatility[year],
-            'Type': 'Benchmark'
-        })
-
-    # Create DataFrame
-    df = pd.DataFrame(all_data)
+    benchmark_annual_returns = _resample_to_annual(benchmark_returns) * 100
+    benchmark_annual_volatility = benchmark_returns.resample('YE').std() * SQRT_TRADING_DAYS * 100
+
+    fund_col.extend([f"🔷 {benchmark_name}"] * len(benchmark_annual_returns))
+    type_col.extend(['Benchmark'] * len(benchmark_annual_returns))
+    year_cols.append(benchmark_annual_returns.index.year.to_numpy())
+    ret_cols.append(benchmark_annual_returns.to_numpy())
+    vol_cols.append(benchmark_annual_volatility.reindex(benchmark_annual_returns.index).to_numpy())
+
+    # Create DataFrame — float32 display columns halve the marker payload
+    # for big categories without visible precision loss at two decimals
+    df = pd.DataFrame({
+        'Fund': fund_col,
+        'Year': np.concatenate(year_cols),
+        'Annual Return': _display_f32(np.concatenate(ret_cols)),
+        'Annual Volatility': _display_f32(np.concatenate(vol_cols)),
+        'Type': type_col
+    })
 
     # Add jitter to Year for better visibility of overlapping bubbles
-    np.random.seed(42)  # For reproducibility
-    df['Year_Jittered'] = df['Year'] + np.random.uniform(-0.15, 0.15, size=len(df))
+    # Local Generator keeps reproducibility without reseeding global state
+    rng = np.random.default_rng(42)
+    df['Year_Jittered'] = _display_f32(df['Year'].to_numpy() + rng.uniform(-0.15, 0.15, size=len(df)))
 
     # Color palette
     colors = [
@@ -1444,50 +1757,48 @@ def create_annual_returns_bubble_chart(returns_dict, benchmark_returns, benchmar
 
     fig = go.Figure()
 
-    # First, add box plot for each year (showing distribution)
+    # First, add box plots showing the per-year distribution. A single trace
+    # with repeated y values draws one box per year — no per-year trace loop.
     years = sorted(df['Year'].unique())
-    for year in years:
-        year_data = df[df['Year'] == year]
-        fig.add_trace(go.Box(
-            x=year_data['Annual Return'],
-            y=[year] * len(year_data),  # All at same Y position
-            name=f'Distribution {year}',
-            orientation='h',
-            marker=dict(color='lightgray', opacity=0.3),
-            line=dict(color='gray', width=1),
-            fillcolor='lightgray',
-            opacity=0.5,
-            boxmean=False,
-            showlegend=False,
-            hoverinfo='skip',  # Don't show hover for box plot
-            width=0.3  # Narrower box plot
-        ))
+    fig.add_trace(go.Box(
+        x=df['Annual Return'],
+        y=df['Year'],
+        name='Distribution',
+        orientation='h',
+        marker=dict(color='lightgray', opacity=0.3),
+        line=dict(color='gray', width=1),
+        fillcolor='lightgray',
+        opacity=0.5,
+        boxmean=False,
+        showlegend=False,
+        hoverinfo='skip',  # Don't show hover for box plot
+        width=0.3  # Narrower box plot
+    ))
 
-    # Get unique funds (excluding benchmark)
-    funds = [f for f in df['Fund'].unique() if not f.startswith('🔷')]
+    # Large categories produce funds x years marker nodes; switch those to
+    # WebGL rendering, which scales far beyond SVG's practical point budget
+    scatter_cls = go.Scattergl if len(df) > 1000 else go.Scatter
 
-    # Plot each fund with jitter
-    for idx, fund_name in enumerate(funds):
-        fund_data = df[df['Fund'] == fund_name].copy()
+    # Plot each fund with jitter — one groupby split instead of a boolean
+    # scan plus copy of the whole table per fund
+    fund_groups = df[df['Type'] == 'Fund'].groupby('Fund', sort=False)
+    for idx, (fund_name, fund_data) in enumerate(fund_groups):
         color = colors[idx % len(colors)]
 
-        # Add year as text for hover
-        fund_data['Year_Text'] = fund_data['Year'].astype(str)
-
-        fig.add_trace(go.Scatter(
-            x=fund_data['Annual Return'],
-            y=fund_data['Year_Jittered'],  # Use jittered year
+        fig.add_trace(scatter_cls(
+            x=fund_data['Annual Return'].to_numpy(),
+            y=fund_data['Year_Jittered'].to_numpy(),  # Use jittered year
             mode='markers',
             name=fund_name,
             marker=dict(
-                size=fund_data['Annual Volatility'],
+                size=fund_data['Annual Volatility'].to_numpy(),
                 sizemode='diameter',
                 sizeref=2,
                 color=color,
                 line=dict(width=1, color='white'),
                 opacity=0.7
             ),
-            customdata=fund_data[['Year', 'Annual Volatility']],
+            customdata=fund_data[['Year', 'Annual Volatility']].to_numpy(),
             hovertemplate='<b>%{fullData.name}</b><br>' +
                          'Year: %{customdata[0]:.0f}<br>' +
                          'Return: %{x:.2f}%<br>' +
@@ -1497,13 +1808,13 @@ def create_annual_returns_bubble_chart(returns_dict, benchmark_returns, benchmar
 
     # Plot benchmark with distinct style (no jitter for benchmark)
     benchmark_data = df[df['Type'] == 'Benchmark'].copy()
-    fig.add_trace(go.Scatter(
-        x=benchmark_data['Annual Return'],
-        y=benchmark_data['Year'],  # No jitter for benchmark
+    fig.add_trace(scatter_cls(
+        x=benchmark_data['Annual Return'].to_numpy(),
+        y=benchmark_data['Year'].to_numpy(),  # No jitter for benchmark
         mode='markers',
         name=f"🔷 {benchmark_name}",
         marker=dict(
-            size=benchmark_data['Annual Volatility'],
+            size=benchmark_data['Annual Volatility'].to_numpy(),
             sizemode='diameter',
             sizeref=2,
             color='#94A3B8',
@@ -1511,7 +1822,7 @@ def create_annual_returns_bubble_chart(returns_dict, benchmark_returns, benchmar
             opacity=0.9,
             symbol='diamond'
         ),
-        customdata=benchmark_data[['Year', 'Annual Volatility']],
+        customdata=benchmark_data[['Year', 'Annual Volatility']].to_numpy(),
         hovertemplate='<b>%{fullData.name}</b><br>' +
                      'Year: %{customdata[0]:.0f}<br>' +
                      'Return: %{x:.2f}%<br>' +
@@ -1562,66 +1873,80 @@ def create_annual_returns_subplots(returns_dict, benchmark_returns, benchmark_na
     Returns:
         Plotly figure with subplots
     """
-    from plotly.subplots import make_subplots
 
     # Get all years in the range
     all_years = list(range(start_date.year, end_date.year + 1))
 
-    # Calculate annual returns for each fund
-    fund_annual_returns = {}
-    for fund_name, returns in returns_dict.items():
-        annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-        fund_annual_returns[fund_name] = {year: None for year in all_years}
-        for year_date in annual_returns.index:
-            year = year_date.year
-            if year in all_years:
-                fund_annual_returns[fund_name][year] = annual_returns[year_date]
-
-    # Calculate benchmark annual returns
-    benchmark_annual = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_by_year = {year: None for year in all_years}
-    for year_date in benchmark_annual.index:
-        year = year_date.year
-        if year in all_years:
-            benchmark_by_year[year] = benchmark_annual[year_date]
+    # One wide (year x fund) frame replaces the per-fund dict-of-years:
+    # relabel to calendar years and reindex to the requested span in a
+    # single C-level pass instead of K x Y Python dict writes
+    annual_wide = _annual_returns_panel(returns_dict) * 100
+    annual_wide = annual_wide.set_axis(annual_wide.index.year).reindex(all_years)
+
+    # Benchmark annual returns on the same year axis
+    benchmark_annual = _resample_to_annual(benchmark_returns) * 100
+    benchmark_by_year = benchmark_annual.set_axis(benchmark_annual.index.year).reindex(all_years)
 
-    # Create subplots - one per year (horizontal columns, newest to oldest)
     num_years = len(all_years)
     reversed_years = list(reversed(all_years))  # Newest year first
 
-    fig = make_subplots(
-        rows=1, cols=num_years,
-        subplot_titles=[str(year) for year in reversed_years],
-        shared_yaxes=True,
-        horizontal_spacing=0.03  # Spacing between columns
-    )
-
     # Get fund names
     fund_names = list(returns_dict.keys())
 
     # Create display names by stripping IDs (everything after "|")
-    display_names = {}
-    for fund_name in fund_names:
-        if '|' in fund_name:
-            display_name = fund_name.split('|')[0].strip()
-        else:
-            display_name = fund_name
-        display_names[fund_name] = display_name
+    display_names = {fund_name: _display_name(fund_name) for fund_name in fund_names}
 
     # Sort fund names alphabetically by display name (reverse so A is at top)
     fund_names_sorted = sorted(fund_names, key=lambda x: display_names[x], reverse=True)
+    display_names_list = [display_names[fn] for fn in fund_names_sorted]
+
+    # One dense reindex covers every (year, fund) cell; the per-year rows
+    # below are plain array slices, newest year first
+    annual_dense = annual_wide.reindex(index=all_years, columns=fund_names_sorted).to_numpy()[::-1]
+    benchmark_dense = benchmark_by_year.to_numpy()[::-1]
+
+    # Long horizons would need one ~400px column and one trace per year;
+    # render those as a single fund x year heatmap instead, which stays a
+    # one-trace figure no matter the span
+    if num_years > 8:
+        z = np.vstack([annual_dense.T, benchmark_dense[None, :]])
+        y_labels = display_names_list + [f"🔷 {benchmark_name}"]
+        cell_text = np.where(np.isnan(z), '', np.char.mod('%.1f%%', np.nan_to_num(z)))
+        fig = go.Figure(go.Heatmap(
+            z=z,
+            x=[str(year) for year in reversed_years],
+            y=y_labels,
+            colorscale='RdYlGn',
+            zmid=0,
+            text=cell_text,
+            texttemplate='%{text}',
+            textfont={"size": 10},
+            colorbar=dict(title="Return (%)")
+        ))
+        fig.update_layout(
+            title=dict(
+                text="Annual Returns by Year - Fund Comparison (Newest to Oldest)",
+                font=dict(size=18, weight='bold')
+            ),
+            height=max(400, len(y_labels) * 40 + 160),
+            template='plotly_white',
+            margin=dict(l=200, r=50, t=100, b=50)
+        )
+        return fig
+
+    # Create subplots - one per year (horizontal columns, newest to oldest)
+    fig = make_subplots(
+        rows=1, cols=num_years,
+        subplot_titles=[str(year) for year in reversed_years],
+        shared_yaxes=True,
+        horizontal_spacing=0.03  # Spacing between columns
+    )
 
     # For each year, create a bar chart
     for col_idx, year in enumerate(reversed_years, start=1):
         # Get returns for this year for all funds (in sorted order)
-        year_returns = []
-        for fund_name in fund_names_sorted:
-            ret = fund_annual_returns[fund_name].get(year)
-            year_returns.append(ret if ret is not None else 0)
-
-        # Add all funds as a single trace for this year
-        display_names_list = [display_names[fn] for fn in fund_names_sorted]
-        text_labels = [f"{ret:.1f}%" for ret in year_returns]
+        year_returns = np.nan_to_num(annual_dense[col_idx - 1])
+        text_labels = np.char.mod('%.1f%%', year_returns)
 
         fig.add_trace(
             go.Bar(
@@ -1639,8 +1964,8 @@ def create_annual_returns_subplots(returns_dict, benchmark_returns, benchmark_na
         )
 
         # Add benchmark as vertical line
-        benchmark_ret = benchmark_by_year.get(year)
-        if benchmark_ret is not None:
+        benchmark_ret = benchmark_dense[col_idx - 1]
+        if pd.notna(benchmark_ret):
             fig.add_vline(
                 x=benchmark_ret,
                 line_dash="dash",
@@ -1695,7 +2020,6 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
     Returns:
         Styled pandas DataFrame
     """
-    import pandas as pd
 
     # Get all years in the range
     all_years = list(range(start_date.year, end_date.year + 1))
@@ -1704,43 +2028,27 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
     # Calculate number of years for CAGR
     num_years = (end_date - start_date).days / 365.25
 
-    # Calculate annual returns for each fund
-    fund_annual_returns = {}
-    fund_cagr = {}
+    # One wide (year x fund) frame replaces the per-fund dict-of-years
+    # (shared memoized panel, relabelled to calendar years)
+    annual_wide = _annual_returns_panel(returns_dict) * 100
+    annual_wide = annual_wide.set_axis(annual_wide.index.year).reindex(all_years)
 
+    fund_cagr = {}
     for fund_name, returns in returns_dict.items():
-        annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-        fund_annual_returns[fund_name] = {year: None for year in all_years}
-        for year_date in annual_returns.index:
-            year = year_date.year
-            if year in all_years:
-                fund_annual_returns[fund_name][year] = annual_returns[year_date]
-
         # Calculate CAGR over entire period
-        cumulative_ret = (1 + returns).prod()
-        cagr = (cumulative_ret ** (1 / num_years) - 1) * 100
-        fund_cagr[fund_name] = cagr
-
-    # Calculate benchmark annual returns and CAGR
-    benchmark_annual = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_by_year = {year: None for year in all_years}
-    for year_date in benchmark_annual.index:
-        year = year_date.year
-        if year in all_years:
-            benchmark_by_year[year] = benchmark_annual[year_date]
-
-    benchmark_cumulative = (1 + benchmark_returns).prod()
+        cumulative_ret = np.exp(np.log1p(returns).sum())
+        fund_cagr[fund_name] = (cumulative_ret ** (1 / num_years) - 1) * 100
+
+    # Calculate benchmark annual returns and CAGR on the same year axis
+    benchmark_annual = _resample_to_annual(benchmark_returns) * 100
+    benchmark_by_year = benchmark_annual.set_axis(benchmark_annual.index.year).reindex(all_years)
+
+    benchmark_cumulative = np.exp(np.log1p(benchmark_returns).sum())
     benchmark_cagr = (benchmark_cumulative ** (1 / num_years) - 1) * 100
 
     # Get fund names and create display names
     fund_names = list(returns_dict.keys())
-    display_names = {}
-    for fund_name in fund_names:
-        if '|' in fund_name:
-            display_name = fund_name.split('|')[0].strip()
-        else:
-            display_name = fund_name
-        display_names[fund_name] = display_name
+    display_names = {fund_name: _display_name(fund_name) for fund_name in fund_names}
 
     # Sort fund names alphabetically by display name
     fund_names_sorted = sorted(fund_names, key=lambda x: display_names[x])
@@ -1748,29 +2056,26 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
     # Build DataFrame
     data_rows = []
 
+    # Beat Benchmark counts for every fund in two C-level comparisons:
+    # a year counts only when both the fund and the benchmark have data
+    both_valid = annual_wide.notna() & benchmark_by_year.notna().to_numpy()[:, None]
+    beat_counts = (annual_wide.gt(benchmark_by_year, axis=0) & both_valid).sum()
+    total_counts = both_valid.sum()
+
     # Add fund rows
     for fund_name in fund_names_sorted:
-        # Calculate Beat Benchmark count
-        beat_count = 0
-        total_count = 0
-        for year in all_years:
-            fund_ret = fund_annual_returns[fund_name].get(year)
-            bench_ret = benchmark_by_year.get(year)
-            # Only count years where both have valid data
-            if fund_ret is not None and bench_ret is not None:
-                total_count += 1
-                if fund_ret > bench_ret:
-                    beat_count += 1
-
-        beat_benchmark_str = f"{beat_count}/{total_count}" if total_count > 0 else "-"
+        fund_col = annual_wide[fund_name]
+
+        total_count = total_counts[fund_name]
+        beat_benchmark_str = f"{beat_counts[fund_name]}/{total_count}" if total_count > 0 else "-"
 
         row = {'Fund Name': display_names[fund_name]}
         row['Beat Benchmark'] = beat_benchmark_str
         row['CAGR'] = fund_cagr[fund_name]
 
         for year in reversed_years:
-            ret = fund_annual_returns[fund_name].get(year)
-            row[str(year)] = ret if ret is not None else None
+            ret = fund_col[year]
+            row[str(year)] = ret if pd.notna(ret) else None
 
         data_rows.append(row)
 
@@ -1779,8 +2084,8 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
     benchmark_row['Beat Benchmark'] = '-'
     benchmark_row['CAGR'] = benchmark_cagr
     for year in reversed_years:
-        bench_ret = benchmark_by_year.get(year)
-        benchmark_row[str(year)] = bench_ret if bench_ret is not None else None
+        bench_ret = benchmark_by_year[year]
+        benchmark_row[str(year)] = bench_ret if pd.notna(bench_ret) else None
     data_rows.append(benchmark_row)
 
     df = pd.DataFrame(data_rows)
@@ -1797,25 +2102,26 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
         # Get benchmark value for this column
         benchmark_val = benchmark_row[s.name]
 
-        # Apply styling to each cell
-        styles = []
-        for idx, val in enumerate(s):
-            # Check if this is the benchmark row
-            if idx == len(s) - 1:  # Last row is benchmark
-                styles.append('background-color: #dbeafe; font-weight: bold')
-            elif pd.isna(val) or pd.isna(benchmark_val):
-                styles.append('')
-            elif val > benchmark_val:
-                styles.append('background-color: #dcfce7')  # Light green
-            elif val < benchmark_val:
-                styles.append('background-color: #fee2e2')  # Light red
-            else:
-                styles.append('background-color: #fef9c3')  # Light yellow
-
-        return styles
-
-    # Get benchmark row for comparison
-    benchmark_row_data = df.iloc[-1]
+        # One nested np.where over the column instead of a per-cell loop:
+        # green above benchmark, red below, yellow equal, blank where
+        # either side is missing; last row is always the benchmark itself
+        vals = s.to_numpy(dtype=np.float64, na_value=np.nan)
+        if pd.isna(benchmark_val):
+            styles = np.full(len(s), '', dtype=object)
+        else:
+            # object dtype so the longer benchmark style below is not
+            # clipped to the fixed-width strings np.where infers
+            styles = np.where(
+                np.isnan(vals), '',
+                np.where(vals > benchmark_val, 'background-color: #dcfce7',   # Light green
+                np.where(vals < benchmark_val, 'background-color: #fee2e2',   # Light red
+                         'background-color: #fef9c3'))).astype(object)        # Light yellow
+        styles[-1] = 'background-color: #dbeafe; font-weight: bold'
+        return styles.tolist()
+
+    # Get benchmark row for comparison, as a plain dict to skip Series
+    # label lookups inside the styling function
+    benchmark_row_data = df.iloc[-1].to_dict()
 
     # Create styled dataframe
     styled_df = df.style.format({
@@ -1823,15 +2129,16 @@ def create_annual_returns_table(returns_dict, benchmark_returns, benchmark_name,
         **{str(year): format_value for year in reversed_years}
     })
 
-    # Apply conditional formatting for each numeric column (CAGR and year columns)
+    # One Styler pass covers every numeric column (CAGR and year columns);
+    # highlight_vs_benchmark keys on s.name, so per-column subsets would
+    # only multiply the internal DataFrame traversals
     numeric_cols = ['CAGR'] + [str(year) for year in reversed_years]
-    for col in numeric_cols:
-        styled_df = styled_df.apply(
-            highlight_vs_benchmark,
-            subset=[col],
-            benchmark_row=benchmark_row_data,
-            axis=0
-        )
+    styled_df = styled_df.apply(
+        highlight_vs_benchmark,
+        subset=numeric_cols,
+        benchmark_row=benchmark_row_data,
+        axis=0
+    )
 
     # Highlight fund name column for benchmark row
     def highlight_benchmark_name(s):
@@ -1853,32 +2160,14 @@ def create_correlation_heatmap(returns_dict, benchmark_returns, benchmark_name):
     Returns:
         Plotly figure
     """
-    import pandas as pd
-    import plotly.graph_objects as go
-
-    def resample_to_monthly(returns):
-        """Resample daily returns to monthly returns"""
-        return returns.resample('ME').apply(lambda x: (1 + x).prod() - 1)
-
-    # Create DataFrame with all returns (monthly)
-    returns_data = {}
-
-    # Add all funds
-    for fund_name, returns in returns_dict.items():
-        monthly_returns = resample_to_monthly(returns)
-        # Create display name (remove code after |)
-        if '|' in fund_name:
-            display_name = fund_name.split('|')[0].strip()
-        else:
-            display_name = fund_name
-        returns_data[display_name] = monthly_returns
-
-    # Add benchmark
-    benchmark_monthly = resample_to_monthly(benchmark_returns)
-    returns_data[f"🔷 {benchmark_name}"] = benchmark_monthly
 
-    # Create DataFrame and align dates
-    returns_df = pd.DataFrame(returns_data)
+    # Resample every fund in one vectorized pass instead of a Python-level
+    # resample per fund, then relabel columns to display names (code after
+    # | removed) and append the benchmark
+    returns_df = _monthly_returns_panel(returns_dict)
+    returns_df.columns = [_display_name(name) for name in returns_df.columns]
+    benchmark_monthly = np.expm1(np.log1p(benchmark_returns).resample('ME').sum(min_count=1))
+    returns_df[f"🔷 {benchmark_name}"] = benchmark_monthly
 
     # Calculate correlation matrix
     corr_matrix = returns_df.corr()
@@ -1891,14 +2180,24 @@ def create_correlation_heatmap(returns_dict, benchmark_returns, benchmark_name):
         [1.0, '#1a9850']    # Green (high correlation)
     ]
 
+    # Per-cell labels are one SVG text node each, F^2 in total — beyond
+    # ~20 funds they dominate browser paint time and are unreadable
+    # anyway, so drop them and rely on hover
+    num_funds = len(corr_matrix)
+    show_text = num_funds <= 20
+
     # Create heatmap with custom colorscale for better distinction of high correlations
     fig = go.Figure(data=go.Heatmap(
         z=corr_matrix.values,
         x=corr_matrix.columns,
         y=corr_matrix.index,
+        # Explicit range keeps the stretched colorscale identical while
+        # sparing the renderer its own min/max scan over z
+        zmin=float(np.nanmin(corr_matrix.values)),
+        zmax=float(np.nanmax(corr_matrix.values)),
         colorscale=custom_colorscale,
-        text=corr_matrix.values,
-        texttemplate='%{text:.2f}',
+        text=corr_matrix.values if show_text else None,
+        texttemplate='%{text:.2f}' if show_text else None,
         textfont={"size": 10},
         colorbar=dict(
             title=dict(text="Correlation", side="right"),
@@ -1909,7 +2208,6 @@ def create_correlation_heatmap(returns_dict, benchmark_returns, benchmark_name):
     ))
 
     # Calculate appropriate height based on number of funds
-    num_funds = len(corr_matrix)
     height = max(500, min(900, num_funds * 40))
 
     fig.update_layout(
@@ -1944,8 +2242,6 @@ def create_cagr_distribution(metrics_df, benchmark_cagr):
     Returns:
         Plotly figure
     """
-    import plotly.graph_objects as go
-    from scipy import stats
 
     # Convert CAGR from decimal to percentage
     cagr_values = metrics_df['CAGR'].values * 100
@@ -1954,9 +2250,8 @@ def create_cagr_distribution(metrics_df, benchmark_cagr):
 
     # Create KDE (density curve)
     cagr_array = np.array(cagr_values)
-    kde = stats.gaussian_kde(cagr_array)
     x_range = np.linspace(cagr_array.min() - 2, cagr_array.max() + 2, 200)
-    density = kde(x_range)
+    density = _kde_density(cagr_array, x_range)
 
     fig = go.Figure()
 
@@ -2001,23 +2296,8 @@ def create_cagr_distribution(metrics_df, benchmark_cagr):
     )
 
     fig.update_layout(
-        title=dict(text="CAGR Distribution", font=dict(size=13, weight='bold', color='#334155')),
-        height=140,
-        margin=dict(l=15, r=15, t=35, b=35),
-        template='plotly_white',
-        showlegend=False,
-        xaxis=dict(
-            showticklabels=True,
-            title='',
-            showgrid=False
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            title='',
-            showgrid=False
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+        _DENSITY_LAYOUT,
+        title=dict(text="CAGR Distribution", font=dict(size=13, weight='bold', color='#334155'))
     )
 
     return fig
@@ -2034,44 +2314,31 @@ def create_annual_returns_distribution(returns_dict, benchmark_returns, start_da
     Returns:
         Plotly figure
     """
-    import plotly.graph_objects as go
-    from scipy import stats
 
     # Get all years in the range
     all_years = list(range(start_date.year, end_date.year + 1))
 
-    # Collect all annual returns from all funds
-    all_annual_returns = []
+    # Pull compound returns from the fused per-year stats panel shared
+    # with the volatility and Sharpe distributions
+    annual_wide = _annual_stats(returns_dict)['compound'] * 100
+    annual_wide = annual_wide.loc[annual_wide.index.isin(all_years)]
+    return_values = annual_wide.to_numpy().ravel()
+    fund_annual_returns = return_values[~np.isnan(return_values)]
 
-    for fund_name, returns in returns_dict.items():
-        annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-        for year_date in annual_returns.index:
-            year = year_date.year
-            if year in all_years:
-                ret = annual_returns[year_date]
-                if not pd.isna(ret):
-                    all_annual_returns.append(ret)
-
-    # Add benchmark annual returns
-    benchmark_annual = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
-    benchmark_annual_values = []
-    for year_date in benchmark_annual.index:
-        year = year_date.year
-        if year in all_years:
-            ret = benchmark_annual[year_date]
-            if not pd.isna(ret):
-                all_annual_returns.append(ret)
-                benchmark_annual_values.append(ret)
+    # Add benchmark annual returns — kept as arrays end to end, no
+    # per-value Python appends
+    benchmark_annual = _resample_to_annual(benchmark_returns) * 100
+    benchmark_annual = benchmark_annual.set_axis(benchmark_annual.index.year)
+    benchmark_annual_values = benchmark_annual.loc[benchmark_annual.index.isin(all_years)].dropna().to_numpy()
+    all_annual_returns_array = np.concatenate([fund_annual_returns, benchmark_annual_values])
 
     # Calculate statistics
-    median_return = np.median(all_annual_returns)
-    benchmark_median = np.median(benchmark_annual_values) if benchmark_annual_values else median_return
+    median_return = np.median(all_annual_returns_array)
+    benchmark_median = np.median(benchmark_annual_values) if len(benchmark_annual_values) else median_return
 
     # Create KDE (density curve)
-    all_annual_returns_array = np.array(all_annual_returns)
-    kde = stats.gaussian_kde(all_annual_returns_array)
     x_range = np.linspace(all_annual_returns_array.min() - 5, all_annual_returns_array.max() + 5, 200)
-    density = kde(x_range)
+    density = _kde_density(all_annual_returns_array, x_range)
 
     fig = go.Figure()
 
@@ -2116,23 +2383,8 @@ def create_annual_returns_distribution(returns_dict, benchmark_returns, start_da
     )
 
     fig.update_layout(
-        title=dict(text="Annual Returns Distribution", font=dict(size=13, weight='bold', color='#334155')),
-        height=140,
-        margin=dict(l=15, r=15, t=35, b=35),
-        template='plotly_white',
-        showlegend=False,
-        xaxis=dict(
-            showticklabels=True,
-            title='',
-            showgrid=False
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            title='',
-            showgrid=False
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+        _DENSITY_LAYOUT,
+        title=dict(text="Annual Returns Distribution", font=dict(size=13, weight='bold', color='#334155'))
     )
 
     return fig
@@ -2150,49 +2402,35 @@ def create_volatility_distribution(returns_dict, benchmark_returns, start_date,
     Returns:
         Plotly figure
     """
-    import plotly.graph_objects as go
-    from scipy import stats
-
-    TRADING_DAYS = 252
 
     # Get all years in the range
     all_years = list(range(start_date.year, end_date.year + 1))
 
-    # Collect all annual volatilities from all funds
-    all_volatilities = []
-
-    for fund_name, returns in returns_dict.items():
-        for year in all_years:
-            # Get returns for this year
-            year_returns = returns[returns.index.year == year]
-            if len(year_returns) > 20:  # At least 20 trading days
-                annual_vol = year_returns.std() * np.sqrt(TRADING_DAYS) * 100
-                if not pd.isna(annual_vol):
-                    all_volatilities.append(annual_vol)
-
-    # Calculate benchmark annual volatilities
-    benchmark_volatilities = []
-    for year in all_years:
-        year_returns = benchmark_returns[benchmark_returns.index.year == year]
-        if len(year_returns) > 20:
-            annual_vol = year_returns.std() * np.sqrt(TRADING_DAYS) * 100
-            if not pd.isna(annual_vol):
-                all_volatilities.append(annual_vol)
-                benchmark_volatilities.append(annual_vol)
-
-    if not all_volatilities:
+    # One grouped reduction over all funds replaces the per-fund, per-year
+    # boolean masks; years with 20 or fewer trading days are dropped
+    year_stats = _annual_stats(returns_dict)
+    fund_vols = (year_stats['std'] * SQRT_TRADING_DAYS * 100).where(year_stats['count'] > 20)
+    fund_vols = fund_vols.loc[fund_vols.index.isin(all_years)]
+    vol_values = fund_vols.to_numpy().ravel()
+    fund_volatilities = vol_values[~np.isnan(vol_values)]
+
+    # Calculate benchmark annual volatilities the same way
+    bench_grp = benchmark_returns.groupby(benchmark_returns.index.year)
+    bench_vols = (bench_grp.std() * SQRT_TRADING_DAYS * 100).where(bench_grp.count() > 20)
+    benchmark_volatilities = bench_vols.loc[bench_vols.index.isin(all_years)].dropna().to_numpy()
+    all_vols_array = np.concatenate([fund_volatilities, benchmark_volatilities])
+
+    if not len(all_vols_array):
         # Return empty figure if no data
         return go.Figure()
 
     # Calculate statistics
-    median_vol = np.median(all_volatilities)
-    benchmark_median_vol = np.median(benchmark_volatilities) if benchmark_volatilities else median_vol
+    median_vol = np.median(all_vols_array)
+    benchmark_median_vol = np.median(benchmark_volatilities) if len(benchmark_volatilities) else median_vol
 
     # Create KDE (density curve)
-    all_vols_array = np.array(all_volatilities)
-    kde = stats.gaussian_kde(all_vols_array)
     x_range = np.linspace(max(0, all_vols_array.min() - 2), all_vols_array.max() + 2, 200)
-    density = kde(x_range)
+    density = _kde_density(all_vols_array, x_range)
 
     fig = go.Figure()
 
@@ -2237,23 +2475,8 @@ def create_volatility_distribution(returns_dict, benchmark_returns, start_date,
     )
 
     fig.update_layout(
-        title=dict(text="Volatility Distribution", font=dict(size=13, weight='bold', color='#334155')),
-        height=140,
-        margin=dict(l=15, r=15, t=35, b=35),
-        template='plotly_white',
-        showlegend=False,
-        xaxis=dict(
-            showticklabels=True,
-            title='',
-            showgrid=False
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            title='',
-            showgrid=False
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+        _DENSITY_LAYOUT,
+        title=dict(text="Volatility Distribution", font=dict(size=13, weight='bold', color='#334155'))
     )
 
     return fig
@@ -2271,53 +2494,42 @@ def create_sharpe_distribution(returns_dict, benchmark_returns, start_date, end_
     Returns:
         Plotly figure
     """
-    import plotly.graph_objects as go
-    from scipy import stats
-
-    TRADING_DAYS = 252
 
     # Get all years in the range
     all_years = list(range(start_date.year, end_date.year + 1))
 
-    # Collect all annual Sharpe ratios from all funds
-    all_sharpes = []
-
-    for fund_name, returns in returns_dict.items():
-        for year in all_years:
-            # Get returns for this year
-            year_returns = returns[returns.index.year == year]
-            if len(year_returns) > 20:  # At least 20 trading days
-                annual_return = year_returns.mean() * TRADING_DAYS
-                annual_vol = year_returns.std() * np.sqrt(TRADING_DAYS)
-                if annual_vol > 0 and not pd.isna(annual_return):
-                    sharpe = (annual_return - risk_free_rate) / annual_vol
-                    all_sharpes.append(sharpe)
-
-    # Calculate benchmark annual Sharpe ratios
-    benchmark_sharpes = []
-    for year in all_years:
-        year_returns = benchmark_returns[benchmark_returns.index.year == year]
-        if len(year_returns) > 20:
-            annual_return = year_returns.mean() * TRADING_DAYS
-            annual_vol = year_returns.std() * np.sqrt(TRADING_DAYS)
-            if annual_vol > 0 and not pd.isna(annual_return):
-                sharpe = (annual_return - risk_free_rate) / annual_vol
-                all_sharpes.append(sharpe)
-                benchmark_sharpes.append(sharpe)
-
-    if not all_sharpes:
+    # Annualized mean and vol come from the same fused stats panel as the
+    # other distribution charts; one elementwise divide yields every
+    # fund x year Sharpe at once
+    year_stats = _annual_stats(returns_dict)
+    annual_return = year_stats['mean'] * TRADING_DAYS
+    annual_vol = year_stats['std'] * SQRT_TRADING_DAYS
+    sharpe_wide = ((annual_return - risk_free_rate) / annual_vol).where(
+        (year_stats['count'] > 20) & (annual_vol > 0))
+    sharpe_wide = sharpe_wide.loc[sharpe_wide.index.isin(all_years)]
+    sharpe_values = sharpe_wide.to_numpy().ravel()
+    fund_sharpes = sharpe_values[~np.isnan(sharpe_values)]
+
+    # Calculate benchmark annual Sharpe ratios the same way
+    bench_grp = benchmark_returns.groupby(benchmark_returns.index.year)
+    bench_return = bench_grp.mean() * TRADING_DAYS
+    bench_vol = bench_grp.std() * SQRT_TRADING_DAYS
+    bench_sharpe = ((bench_return - risk_free_rate) / bench_vol).where(
+        (bench_grp.count() > 20) & (bench_vol > 0))
+    benchmark_sharpes = bench_sharpe.loc[bench_sharpe.index.isin(all_years)].dropna().to_numpy()
+    all_sharpes_array = np.concatenate([fund_sharpes, benchmark_sharpes])
+
+    if not len(all_sharpes_array):
         # Return empty figure if no data
         return go.Figure()
 
     # Calculate statistics
-    median_sharpe = np.median(all_sharpes)
-    benchmark_median_sharpe = np.median(benchmark_sharpes) if benchmark_sharpes else median_sharpe
+    median_sharpe = np.median(all_sharpes_array)
+    benchmark_median_sharpe = np.median(benchmark_sharpes) if len(benchmark_sharpes) else median_sharpe
 
     # Create KDE (density curve)
-    all_sharpes_array = np.array(all_sharpes)
-    kde = stats.gaussian_kde(all_sharpes_array)
     x_range = np.linspace(all_sharpes_array.min() - 0.5, all_sharpes_array.max() + 0.5, 200)
-    density = kde(x_range)
+    density = _kde_density(all_sharpes_array, x_range)
 
     fig = go.Figure()
 
@@ -2362,23 +2574,8 @@ def create_sharpe_distribution(returns_dict, benchmark_returns, start_date, end_
     )
 
     fig.update_layout(
-        title=dict(text="Sharpe Ratio Distribution", font=dict(size=13, weight='bold', color='#334155')),
-        height=140,
-        margin=dict(l=15, r=15, t=35, b=35),
-        template='plotly_white',
-        showlegend=False,
-        xaxis=dict(
-            showticklabels=True,
-            title='',
-            showgrid=False
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            title='',
-            showgrid=False
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+        _DENSITY_LAYOUT,
+        title=dict(text="Sharpe Ratio Distribution", font=dict(size=13, weight='bold', color='#334155'))
     )
 
     return fig
@@ -2393,34 +2590,30 @@ def create_max_drawdown_distribution(returns_dict, benchmark_returns):
     Returns:
         Plotly figure
     """
-    import plotly.graph_objects as go
-    from scipy import stats
 
-    # Calculate max drawdown for each fund
-    max_drawdowns = []
-    for fund_name, returns in returns_dict.items():
-        cumulative = (1 + returns).cumprod()
-        running_max = cumulative.expanding().max()
-        drawdown = (cumulative - running_max) / running_max
-        max_dd = drawdown.min() * 100  # Convert to percentage
-        max_drawdowns.append(max_dd)
-
-    # Calculate benchmark max drawdown and find the year it occurred
-    bench_cumulative = (1 + benchmark_returns).cumprod()
-    bench_running_max = bench_cumulative.expanding().max()
+    # One panel-wide pass replaces the per-fund cumprod/cummax chain:
+    # log-space cumsum skips pre-inception NaNs, and the column minima
+    # give every fund's max drawdown at once
+    panel = pd.concat(returns_dict, axis=1)
+    cum_panel = np.exp(np.log1p(panel).cumsum())
+    dd_panel = cum_panel / cum_panel.cummax() - 1
+    fund_max_drawdowns = (dd_panel.min() * 100).to_numpy()  # In percentage
+
+    # Calculate benchmark max drawdown and find the year it occurred —
+    # plain ufunc chain, with the trough date read back off the index
+    bench_cumulative = np.cumprod(1.0 + benchmark_returns.to_numpy())
+    bench_running_max = np.maximum.accumulate(bench_cumulative)
     bench_drawdown = (bench_cumulative - bench_running_max) / bench_running_max
     bench_max_dd = bench_drawdown.min() * 100
-    bench_max_dd_date = bench_drawdown.idxmin()
+    bench_max_dd_date = benchmark_returns.index[bench_drawdown.argmin()]
     bench_max_dd_year = bench_max_dd_date.year if hasattr(bench_max_dd_date, 'year') else 'N/A'
 
-    max_drawdowns.append(bench_max_dd)
-    median_dd = np.median(max_drawdowns)
+    dd_array = np.append(fund_max_drawdowns, bench_max_dd)
+    median_dd = np.median(dd_array)
 
     # Create KDE (density curve)
-    dd_array = np.array(max_drawdowns)
-    kde = stats.gaussian_kde(dd_array)
     x_range = np.linspace(dd_array.min() - 2, dd_array.max() + 2, 200)
-    density = kde(x_range)
+    density = _kde_density(dd_array, x_range)
 
     fig = go.Figure()
 
@@ -2465,23 +2658,8 @@ def create_max_drawdown_distribution(returns_dict, benchmark_returns):
     )
 
     fig.update_layout(
-        title=dict(text="Max Drawdown Distribution", font=dict(size=13, weight='bold', color='#334155')),
-        height=140,
-        margin=dict(l=15, r=15, t=35, b=35),
-        template='plotly_white',
-        showlegend=False,
-        xaxis=dict(
-            showticklabels=True,
-            title='',
-            showgrid=False
-        ),
-        yaxis=dict(
-            showticklabels=False,
-            title='',
-            showgrid=False
-        ),
-        paper_bgcolor='rgba(0,0,0,0)',
-        plot_bgcolor='rgba(0,0,0,0)'
+        _DENSITY_LAYOUT,
+        title=dict(text="Max Drawdown Distribution", font=dict(size=13, weight='bold', color='#334155'))
     )
 
     return fig
@@ -2502,24 +2680,29 @@ def create_bubble_scatter_chart(metrics_df, x_metric, y_metric, size_metric, fun
     Returns:
         Plotly figure
     """
-    # Prepare data
-    df = metrics_df.copy()
-
-    # Handle percentage metrics - convert to numeric if needed
-    for col in [x_metric, y_metric, size_metric]:
-        if df[col].dtype == 'object':
+    # Handle percentage metrics - only copy when a %-string column actually
+    # needs converting; the all-numeric case reads the caller's frame as-is
+    object_cols = [col for col in (x_metric, y_metric, size_metric)
+                   if metrics_df[col].dtype == 'object']
+    if object_cols:
+        df = metrics_df.copy()
+        for col in object_cols:
             # Remove % signs and convert
             df[col] = pd.to_numeric(df[col].astype(str).str.rstrip('%'), errors='coerce')
+    else:
+        df = metrics_df
 
     # Remove rows with NaN in key metrics
     df = df.dropna(subset=[x_metric, y_metric, size_metric])
 
     # Normalize size metric for bubble sizing (scale 5-50)
     size_values = df[size_metric].values
-    if size_values.max() != size_values.min():
-        normalized_sizes = 5 + 45 * (size_values - size_values.min()) / (size_values.max() - size_values.min())
+    size_min = size_values.min()
+    size_span = size_values.max() - size_min
+    if size_span != 0:
+        normalized_sizes = 5 + 45 * (size_values - size_min) / size_span
     else:
-        normalized_sizes = [25] * len(size_values)
+        normalized_sizes = np.full(len(size_values), 25.0)
 
     # Create color scale based on fund names
     unique_funds = df[fund_name_col].unique()
@@ -2530,14 +2713,14 @@ def create_bubble_scatter_chart(metrics_df, x_metric, y_metric, size_metric, fun
     color_map = {fund: color_palette[i % len(color_palette)] for i, fund in enumerate(unique_funds)}
     colors = df[fund_name_col].map(color_map)
 
-    # Create hover text with all metrics
-    hover_texts = []
-    for _, row in df.iterrows():
-        text = f"<b>{row[fund_name_col]}</b><br>"
-        text += f"{x_metric}: {row[x_metric]:.2f}<br>"
-        text += f"{y_metric}: {row[y_metric]:.2f}<br>"
-        text += f"{size_metric}: {row[size_metric]:.2f}"
-        hover_texts.append(text)
+    # Create hover text with all metrics (vectorized string concat — iterrows
+    # materializes a Series per row and is far slower)
+    hover_texts = (
+        '<b>' + df[fund_name_col].astype(str) + '</b><br>'
+        + f'{x_metric}: ' + np.char.mod('%.2f', df[x_metric].to_numpy()) + '<br>'
+        + f'{y_metric}: ' + np.char.mod('%.2f', df[y_metric].to_numpy()) + '<br>'
+        + f'{size_metric}: ' + np.char.mod('%.2f', df[size_metric].to_numpy())
+    )
 
     fig = go.Figure()
 
@@ -2559,16 +2742,21 @@ def create_bubble_scatter_chart(metrics_df, x_metric, y_metric, size_metric, fun
 
     # Add fund name annotations for clarity (optional, for top performers)
     if len(df) <= 15:  # Only annotate if not too many funds
-        for _, row in df.iterrows():
-            fig.add_annotation(
-                x=row[x_metric],
-                y=row[y_metric],
-                text=row[fund_name_col][:20],  # Truncate long names
+        # Build all annotations in one pass and hand them to the layout in a
+        # single update — add_annotation revalidates the layout per call
+        fig.update_layout(annotations=[
+            dict(
+                x=x,
+                y=y,
+                text=name[:20],  # Truncate long names
                 showarrow=False,
                 font=dict(size=8),
                 opacity=0.6,
                 yshift=10
             )
+            for x, y, name in zip(df[x_metric].values, df[y_metric].values,
+                                  df[fund_name_col].values)
+        ])
 
     # Add benchmark reference lines if provided
     if benchmark_x is not None:
@@ -2626,11 +2814,6 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
     Returns:
         Plotly figure
     """
-    import pandas as pd
-    import numpy as np
-    import plotly.graph_objects as go
-    from src.metrics import calculate_sharpe_ratio, calculate_max_drawdown, calculate_cagr
-
     # Convert dates to Timestamps to ensure compatibility
     start_date = pd.Timestamp(start_date)
     end_date = pd.Timestamp(end_date)
@@ -2639,100 +2822,85 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
     years = list(range(start_date.year, end_date.year + 1))
 
     # Create display names by stripping IDs (everything after "|")
-    display_names = {}
-    for fund_name in returns_dict.keys():
-        if '|' in fund_name:
-            display_name = fund_name.split('|')[0].strip()
-        else:
-            display_name = fund_name
-        display_names[fund_name] = display_name
-
-    # Calculate metrics for each fund for each year
-    fund_year_data = []
+    display_names = {fund_name: _display_name(fund_name) for fund_name in returns_dict}
 
-    for fund_name, returns in returns_dict.items():
-        for year in years:
-            year_start = pd.Timestamp(f"{year}-01-01")
-            year_end = pd.Timestamp(f"{year}-12-31")
-
-            if ranking_mode == 'annual':
-                # Annual mode: metrics for just this year
-                year_returns = returns[(returns.index >= year_start) & (returns.index <= year_end)]
-            else:
-                # Cumulative mode: metrics from start_date to end of this year
-                year_returns = returns[(returns.index >= start_date) & (returns.index <= year_end)]
-
-            if len(year_returns) > 20:  # Need minimum data points
-                # Calculate annual CAGR
-                total_return = (1 + year_returns).prod() - 1
-                if ranking_mode == 'annual':
-                    years_period = len(year_returns) / 252
-                else:
-                    years_period = (year_end - pd.Timestamp(start_date)).days / 365.25
-
-                if years_period > 0:
-                    cagr = ((1 + total_return) ** (1 / years_period) - 1) * 100
-                else:
-                    continue
-
-                # Calculate other metrics
-                volatility = year_returns.std() * np.sqrt(252) * 100
-                sharpe = calculate_sharpe_ratio(year_returns, risk_free_rate)
-                max_dd = calculate_max_drawdown(year_returns) * 100
-
-                # Calculate annual return (total return for the period, not annualized)
-                annual_return = total_return * 100
-
-                fund_year_data.append({
-                    'Fund': fund_name,
-                    'Year': year,
-                    'CAGR': cagr,
-                    'Annual Return': annual_return,
-                    'Sharpe': sharpe,
-                    'Volatility': volatility,
-                    'Max DD': max_dd
-                })
-
-    # Add benchmark data
     benchmark_full_name = f"🔷 {benchmark_name}"
     display_names[benchmark_full_name] = benchmark_name  # Add benchmark to display_names
 
-    for year in years:
-        year_start = pd.Timestamp(f"{year}-01-01")
-        year_end = pd.Timestamp(f"{year}-12-31")
-
-        if ranking_mode == 'annual':
-            year_returns = benchmark_returns[(benchmark_returns.index >= year_start) & (benchmark_returns.index <= year_end)]
-        else:
-            year_returns = benchmark_returns[(benchmark_returns.index >= start_date) & (benchmark_returns.index <= year_end)]
-
-        if len(year_returns) > 20:
-            total_return = (1 + year_returns).prod() - 1
-            if ranking_mode == 'annual':
-                years_period = len(year_returns) / 252
-            else:
-                years_period = (year_end - pd.Timestamp(start_date)).days / 365.25
-
-            if years_period > 0:
-                cagr = ((1 + total_return) ** (1 / years_period) - 1) * 100
-                volatility = year_returns.std() * np.sqrt(252) * 100
-                sharpe = calculate_sharpe_ratio(year_returns, risk_free_rate)
-                max_dd = calculate_max_drawdown(year_returns) * 100
-
-                # Calculate annual return (total return for the period, not annualized)
-                annual_return = total_return * 100
-
-                fund_year_data.append({
-                    'Fund': benchmark_full_name,
-                    'Year': year,
-                    'CAGR': cagr,
-                    'Annual Return': annual_return,
-                    'Sharpe': sharpe,
-                    'Volatility': volatility,
-                    'Max DD': max_dd
-                })
-
-    df = pd.DataFrame(fund_year_data)
+    # Funds and benchmark share one panel; every per-year metric below is
+    # a grouped (annual mode) or running (cumulative mode) reduction over
+    # the whole fund x day matrix instead of F x Y boolean slices
+    panel = pd.concat({**returns_dict, benchmark_full_name: benchmark_returns}, axis=1)
+
+    if ranking_mode == 'annual':
+        # Annual mode: metrics for just this year
+        year_keys = panel.index.year
+        log_panel = np.log1p(panel)
+        grp = panel.groupby(year_keys)
+        counts = grp.count()
+        means = grp.mean()
+        stds = grp.std()
+        total_return = np.expm1(log_panel.groupby(year_keys).sum(min_count=1))
+        # Within-year drawdown: growth, peak and trough all stay inside
+        # each calendar-year group
+        cum = np.exp(log_panel.groupby(year_keys).cumsum())
+        drawdown = cum / cum.groupby(year_keys).cummax() - 1
+        max_dd = drawdown.groupby(year_keys).min()
+        years_period = counts / 252
+    else:
+        # Cumulative mode: metrics from start_date to end of this year,
+        # read off running sums at each year-end row instead of
+        # recomputing every expanding window from scratch
+        year_ends = pd.DatetimeIndex([pd.Timestamp(f"{year}-12-31") for year in years])
+        sub = panel[(panel.index >= start_date) & (panel.index <= year_ends[-1])]
+        log_sub = np.log1p(sub)
+        counts_run = sub.notna().cumsum()
+        sum_run = sub.fillna(0).cumsum()
+        sumsq_run = (sub ** 2).fillna(0).cumsum()
+        log_run = log_sub.fillna(0).cumsum()
+        cum = np.exp(log_sub.cumsum())
+        dd_run = (cum / cum.cummax() - 1).cummin().ffill()
+
+        pos = np.maximum(sub.index.searchsorted(year_ends, side='right') - 1, 0)
+
+        def _at_year_ends(frame):
+            return frame.iloc[pos].set_axis(years)
+
+        counts = _at_year_ends(counts_run)
+        sums = _at_year_ends(sum_run)
+        means = sums / counts
+        # Expanding std from running sum and sum of squares (ddof=1)
+        stds = np.sqrt((_at_year_ends(sumsq_run) - sums ** 2 / counts) / (counts - 1))
+        total_return = np.expm1(_at_year_ends(log_run))
+        max_dd = _at_year_ends(dd_run)
+        years_period = pd.DataFrame(
+            np.broadcast_to(((year_ends - start_date).days.values / 365.25)[:, None], counts.shape),
+            index=counts.index, columns=counts.columns)
+
+    cagr = ((1 + total_return) ** (1 / years_period) - 1) * 100
+    annual_return = total_return * 100  # Total return for the period, not annualized
+    volatility = stds * SQRT_TRADING_DAYS * 100
+    ann_vol = stds * SQRT_TRADING_DAYS
+    sharpe = (means * TRADING_DAYS - risk_free_rate).div(ann_vol).where(ann_vol != 0, 0.0)
+
+    # Need minimum data points, and only years inside the requested range
+    valid = counts.gt(20)
+    valid.loc[~valid.index.isin(years)] = False
+
+    # Long format in fund-major order, matching the old nested-loop row
+    # order so rank tie-breaking stays stable
+    metric_frames = {
+        'CAGR': cagr,
+        'Annual Return': annual_return,
+        'Sharpe': sharpe,
+        'Volatility': volatility,
+        'Max DD': max_dd * 100,
+    }
+    long_df = pd.DataFrame({name: frame.where(valid).T.stack()
+                            for name, frame in metric_frames.items()})
+    long_df = long_df.dropna(subset=['CAGR'])
+    long_df.index.names = ['Fund', 'Year']
+    df = long_df.reset_index()
 
     if df.empty:
         # Return empty figure with message
@@ -2745,90 +2913,94 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
         )
         return fig
 
+    # Fund names repeat once per year — group on category codes instead of
+    # re-hashing the strings on every groupby/pivot
+    df['Fund'] = df['Fund'].astype('category')
+
     # Rank funds by CAGR for each year (break ties by fund name for consistency)
     df['Rank'] = df.groupby('Year')['CAGR'].rank(ascending=False, method='first').astype(int)
 
     # Calculate average rank for each fund across all years
-    avg_ranks = df.groupby('Fund')['Rank'].mean()
+    # (sort=False: group keys don't need to be pre-sorted, the order is
+    # decided by the sort_values below)
+    avg_ranks = df.groupby('Fund', sort=False)['Rank'].mean()
 
     # Sort funds by average rank (best performers first)
     fund_order = avg_ranks.sort_values().index.tolist()
 
-    # Create pivot for heatmap (Fund x Year -> CAGR for coloring)
-    pivot_cagr = df.pivot(index='Fund', columns='Year', values='CAGR')
-
-    # Reorder rows by average rank (best performers at top)
-    pivot_cagr = pivot_cagr.reindex(fund_order)
-
-    # Create annotations with rank and metrics for each fund
-    annotations = []
-
-    for fund_name in pivot_cagr.index:
-        for year in pivot_cagr.columns:
-            # Get fund data for this fund and year
-            fund_data = df[(df['Fund'] == fund_name) & (df['Year'] == year)]
-
-            if not fund_data.empty:
-                row = fund_data.iloc[0]
-
-                # Check if this is a benchmark
-                is_benchmark = fund_name.startswith('🔷')
-
-                # Create multi-line annotation (showing Rank first, then metrics)
-                text = f"<b>Rank: {row['Rank']:.0f}</b><br>" \
-                       f"Ann Ret: {row['Annual Return']:.1f}%<br>" \
-                       f"CAGR: {row['CAGR']:.1f}%<br>" \
-                       f"SR: {row['Sharpe']:.2f} | DD: {row['Max DD']:.1f}%<br>" \
-                       f"Vol: {row['Volatility']:.1f}%"
-
-                # Emphasize benchmark with different styling
-                if is_benchmark:
-                    annotations.append(
-                        dict(
-                            x=year,
-                            y=fund_name,
-                            text=text,
-                            showarrow=False,
-                            font=dict(size=9, color='#1e40af', family='Arial Black'),  # Bold blue font
-                            bgcolor='#fef3c7',  # Light yellow background
-                            bordercolor='#1E3A5F',  # Orange border
-                            borderwidth=2,
-                            borderpad=4,
-                            xref='x',
-                            yref='y'
-                        )
-                    )
-                else:
-                    annotations.append(
-                        dict(
-                            x=year,
-                            y=fund_name,
-                            text=text,
-                            showarrow=False,
-                            font=dict(size=9, color='black'),
-                            xref='x',
-                            yref='y'
-                        )
-                    )
+    # Build the Fund x Year CAGR matrix with one NumPy scatter instead of
+    # pivot + reindex: rows come out directly in average-rank order
+    years_axis = np.sort(df['Year'].unique())
+    row_idx = pd.Index(fund_order).get_indexer(df['Fund'])
+    col_idx = np.searchsorted(years_axis, df['Year'].to_numpy())
+    # float32 is plenty for a colour matrix and halves the buffer that the
+    # min/max pass and the JSON encoder have to walk
+    grid = np.full((len(fund_order), years_axis.size), np.nan, dtype=np.float32)
+    grid[row_idx, col_idx] = df['CAGR'].to_numpy(dtype=np.float32)
+
+    # Create annotations with rank and metrics for each fund.
+    # df already holds exactly one row per populated (fund, year) cell, so
+    # iterate it directly instead of re-filtering df for every grid cell
+    # (the old nested loop did a full boolean scan per cell)
+    # Assemble the multi-line cell text for all rows at once with Series
+    # string concatenation — per-cell f-strings are pure interpreter overhead
+    # once the grid grows to hundreds of cells
+    cell_text = (
+        '<b>Rank: ' + df['Rank'].astype(str) + '</b><br>'
+        'Ann Ret: ' + np.char.mod('%.1f%%', df['Annual Return'].to_numpy()) + '<br>'
+        'CAGR: ' + np.char.mod('%.1f%%', df['CAGR'].to_numpy()) + '<br>'
+        'SR: ' + np.char.mod('%.2f', df['Sharpe'].to_numpy())
+        + ' | DD: ' + np.char.mod('%.1f%%', df['Max DD'].to_numpy()) + '<br>'
+        'Vol: ' + np.char.mod('%.1f%%', df['Volatility'].to_numpy())
+    )
+
+    # Styling dicts built once and shared — Plotly copies them during
+    # layout validation, so no per-annotation dict construction is needed
+    benchmark_style = dict(
+        showarrow=False,
+        font=dict(size=9, color='#1e40af', family='Arial Black'),  # Bold blue font
+        bgcolor='#fef3c7',  # Light yellow background
+        bordercolor='#1E3A5F',  # Orange border
+        borderwidth=2,
+        borderpad=4,
+        xref='x',
+        yref='y'
+    )
+    fund_style = dict(
+        showarrow=False,
+        font=dict(size=9, color='black'),
+        xref='x',
+        yref='y'
+    )
+
+    # Emphasize benchmark with different styling
+    annotations = [
+        dict(x=year, y=fund_name, text=text,
+             **(benchmark_style if fund_name.startswith('🔷') else fund_style))
+        for fund_name, year, text in zip(df['Fund'], df['Year'], cell_text)
+    ]
+
+    # Single-pass reductions over the matrix for the colorbar range
+    cagr_min = np.nanmin(grid)
+    cagr_max = np.nanmax(grid)
 
     # Create heatmap with transparent color scale and borders
     fig = go.Figure(data=go.Heatmap(
-        z=pivot_cagr.values,
-        x=pivot_cagr.columns,
-        y=pivot_cagr.index,
+        z=grid,
+        x=years_axis,
+        y=fund_order,
         colorscale=[
             [0, 'rgba(220, 38, 38, 0.4)'],      # Red for low CAGR (40% opacity)
             [0.5, 'rgba(234, 179, 8, 0.35)'],   # Yellow for medium (35% opacity)
             [1, 'rgba(34, 197, 94, 0.5)']       # Green for high CAGR (50% opacity)
         ],
         zmid=0,  # Center colorscale at 0
-        text=pivot_cagr.values,
         hovertemplate='Year: %{x}<br>Fund: %{y}<br>CAGR: %{z:.2f}%<extra></extra>',
         colorbar=dict(
             title=dict(text="CAGR (%)", side="right"),
             tickmode="linear",
-            tick0=pivot_cagr.min().min(),
-            dtick=(pivot_cagr.max().max() - pivot_cagr.min().min()) / 5
+            tick0=cagr_min,
+            dtick=(cagr_max - cagr_min) / 5
         ),
         xgap=1,  # Horizontal gap between cells (reduced for more cell space)
         ygap=1   # Vertical gap between cells (reduced for more cell space)
@@ -2865,7 +3037,7 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
         return '<br>'.join(lines)
 
     # Create clean Y-axis labels with wrapping (fund names without IDs)
-    yaxis_labels = [wrap_label(display_names[fn]) for fn in pivot_cagr.index]
+    yaxis_labels = [wrap_label(display_names[fn]) for fn in fund_order]
 
     fig.update_layout(
         title=dict(
@@ -2874,7 +3046,7 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
         ),
         xaxis_title="Year",
         yaxis_title="Fund Name",
-        height=max(600, len(pivot_cagr.index) * 80),  # Dynamic height based on number of funds (larger cells)
+        height=max(600, len(fund_order) * 80),  # Dynamic height based on number of funds (larger cells)
         margin=dict(l=250, r=50, t=100, b=50),  # Increased left margin for wrapped labels
         template='plotly_white',
         xaxis=dict(
@@ -2887,7 +3059,7 @@ def create_performance_ranking_grid(returns_dict, benchmark_returns, benchmark_n
         yaxis=dict(
             autorange='reversed',  # Best performers (lowest avg rank) at top
             tickmode='array',
-            tickvals=list(range(len(pivot_cagr.index))),
+            tickvals=list(range(len(fund_order))),
             ticktext=yaxis_labels,
             showgrid=True,
             gridwidth=2,
@@ -2914,11 +3086,10 @@ def create_rolling_metric_chart(returns_dict, benchmark_returns, benchmark_name,
     Returns:
         Plotly figure
     """
-    MONTHS_PER_YEAR = 12
-    fig = go.Figure()
-
-    # Convert window from days to months (approximate: 21 trading days per month)
-    window_months = int(window / 21)
+    # Convert window from days to months (approximate: 21 trading days per
+    # month). Clamp to at least 2: sub-2-month windows would run the whole
+    # resample/rolling pipeline only to produce degenerate values
+    window_months = max(2, int(window / 21))
 
     # Color palette
     colors = [
@@ -2929,45 +3100,18 @@ def create_rolling_metric_chart(returns_dict, benchmark_returns, benchmark_name,
     # Grayscale color for unselected funds
     grayscale_color = '#999999'
 
-    def resample_to_monthly(returns):
-        """Resample daily returns to monthly returns"""
-        # Use 'ME' (Month End) frequency and calculate compound return for each month
-        return returns.resample('ME').apply(lambda x: (1 + x).prod() - 1)
-
-    def calculate_rolling_metric(returns, metric_type, window_months):
-        """Calculate rolling metric based on type using monthly data"""
-        if metric_type == "Return":
-            # Annualized rolling return
-            return returns.rolling(window_months).apply(lambda x: (1 + x).prod() - 1) * (MONTHS_PER_YEAR / window_months) * 100
-        elif metric_type == "Volatility":
-            # Annualized rolling volatility
-            return returns.rolling(window_months).std() * np.sqrt(MONTHS_PER_YEAR) * 100
-        elif metric_type == "Sharpe":
-            # Rolling Sharpe ratio
-            rolling_mean = returns.rolling(window_months).mean() * MONTHS_PER_YEAR
-            rolling_std = returns.rolling(window_months).std() * np.sqrt(MONTHS_PER_YEAR)
-            return (rolling_mean - risk_free_rate) / rolling_std
-        elif metric_type == "Drawdown":
-            # Rolling max drawdown
-            rolling_dd = []
-            for i in range(len(returns)):
-                if i < window_months:
-                    rolling_dd.append(np.nan)
-                else:
-                    window_returns = returns.iloc[i-window_months:i]
-                    cum_returns = (1 + window_returns).cumprod()
-                    running_max = cum_returns.expanding().max()
-                    dd = ((cum_returns - running_max) / running_max * 100).min()
-                    rolling_dd.append(dd)
-            return pd.Series(rolling_dd, index=returns.index)
-        else:
-            raise ValueError(f"Unknown metric type: {metric_type}")
+    # Resample all funds to monthly in one pass instead of per fund
+    monthly_panel = _monthly_returns_panel(returns_dict)
+
+    # Collect traces and add them in one batch at the end — one validation
+    # pass instead of one per fund
+    traces = []
 
     # Plot each fund
-    for idx, (fund_name, returns) in enumerate(returns_dict.items()):
-        # Resample to monthly
-        monthly_returns = resample_to_monthly(returns)
-        metric_values = calculate_rolling_metric(monthly_returns, metric_type, window_months)
+    for idx, fund_name in enumerate(returns_dict):
+        # concat aligns funds with different histories, so drop the padding
+        monthly_returns = monthly_panel[fund_name].dropna()
+        metric_values = _calculate_rolling_metric(monthly_returns, metric_type, window_months, risk_free_rate)
 
         # Drop NaN values to avoid showing initial period with insufficient data
         metric_values = metric_values.dropna()
@@ -2989,7 +3133,7 @@ def create_rolling_metric_chart(returns_dict, benchmark_returns, benchmark_name,
             opacity = 0.3  # More transparent
             width = 1.0    # Thinner
 
-        fig.add_trace(go.Scatter(
+        traces.append(go.Scatter(
             x=metric_values.index,
             y=metric_values,
             name=fund_name,
@@ -2999,13 +3143,13 @@ def create_rolling_metric_chart(returns_dict, benchmark_returns, benchmark_name,
         ))
 
     # Add benchmark
-    monthly_benchmark = resample_to_monthly(benchmark_returns)
-    benchmark_metric = calculate_rolling_metric(monthly_benchmark, metric_type, window_months)
+    monthly_benchmark = _resample_to_monthly(benchmark_returns)
+    benchmark_metric = _calculate_rolling_metric(monthly_benchmark, metric_type, window_months, risk_free_rate)
 
     # Drop NaN values for benchmark as well
     benchmark_metric = benchmark_metric.dropna()
 
-    fig.add_trace(go.Scatter(
+    traces.append(go.Scatter(
         x=benchmark_metric.index,
         y=benchmark_metric,
         name=f"🔷 {benchmark_name}",
@@ -3013,6 +3157,8 @@ def create_rolling_metric_chart(returns_dict, benchmark_returns, benchmark_name,
         hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Value: %{y:.2f}<extra></extra>'
     ))
 
+    fig = go.Figure(data=traces)
+
     # Determine Y-axis label and title
     y_labels = {
         "Return": "Annualized Return (%)",
@@ -3119,10 +3265,9 @@ def create_distribution_chart(data_df, value_column, category_column,
         
         # Calculate KDE
         try:
-            kde = stats.gaussian_kde(cat_data)
             x_range = np.linspace(cat_data.min() - abs(cat_data.min())*0.1, 
                                  cat_data.max() + abs(cat_data.max())*0.1, 300)
-            kde_values = kde(x_range)
+            kde_values = _kde_density(cat_data.to_numpy(), x_range)
         except:
             # Fallback if KDE fails (e.g., all same values)
             x_range = np.linspace(cat_data.min(), cat_data.max(), 100)
@@ -3311,33 +3456,34 @@ def create_return_box_plot_chart(equity_df, order_by='median'):
     # Create figure
     fig = go.Figure()
 
-    # Add box plot for each category
-    for category in category_order:
-        category_data = equity_df[equity_df['scheme_category_level2'] == category]
-        n_funds = len(category_data)
-
-        fig.add_trace(go.Box(
-            y=category_data['pct_return'],
-            x=[category] * len(category_data),
-            name=category,
-            marker=dict(
-                color='#64748b',
-                opacity=0.6,
-                outliercolor='#ef4444',
-                line=dict(width=0)
-            ),
-            line=dict(color='#334155', width=1.5),
-            fillcolor='rgba(100, 116, 139, 0.25)',
-            boxmean=True,  # Show mean as dashed line
-            boxpoints='outliers',  # Show outliers only
-            showlegend=False,
-            hovertemplate=(
-                '<b>%{fullData.name}</b><br>' +
-                'Return: %{y:.0f}%<br>' +
-                f'N: {n_funds}<br>' +
-                '<extra></extra>'
-            )
-        ))
+    # One Box trace with the category column as x draws one box per
+    # category — no per-group boolean filter or trace serialization; the
+    # axis categoryarray below keeps the ordering
+    fund_counts = equity_df['scheme_category_level2'].map(
+        category_stats.set_index('scheme_category_level2')['count']
+    )
+    fig.add_trace(go.Box(
+        y=equity_df['pct_return'],
+        x=equity_df['scheme_category_level2'],
+        customdata=fund_counts,
+        marker=dict(
+            color='#64748b',
+            opacity=0.6,
+            outliercolor='#ef4444',
+            line=dict(width=0)
+        ),
+        line=dict(color='#334155', width=1.5),
+        fillcolor='rgba(100, 116, 139, 0.25)',
+        boxmean=True,  # Show mean as dashed line
+        boxpoints='outliers',  # Show outliers only
+        showlegend=False,
+        hovertemplate=(
+            '<b>%{x}</b><br>' +
+            'Return: %{y:.0f}%<br>' +
+            'N: %{customdata}<br>' +
+            '<extra></extra>'
+        )
+    ))
 
     # Add zero reference line
     fig.add_hline(
@@ -3458,8 +3604,6 @@ def create_monthly_returns_scatter(strategy_monthly_returns, benchmark_monthly_r
     Returns:
         plotly.graph_objects.Figure
     """
-    import plotly.graph_objects as go
-    import numpy as np
 
     # Align series to matching dates
     aligned_fund, aligned_bench = strategy_monthly_returns.align(
@@ -3485,8 +3629,7 @@ def create_monthly_returns_scatter(strategy_monthly_returns, benchmark_monthly_r
             line=dict(width=1, color='white'),
             opacity=0.7
         ),
-        text=[f"Date: {d.strftime('%b %Y')}<br>Benchmark: {b:.2f}%<br>{strategy_name}: {f:.2f}%"
-              for d, b, f in zip(dates, bench_pct, fund_pct)],
+        text=_scatter_hover_text(dates, bench_pct, fund_pct, strategy_name),
         hovertemplate='%{text}<extra></extra>',
         name=strategy_name,
         showlegend=True
@@ -3534,8 +3677,7 @@ def create_monthly_returns_scatter(strategy_monthly_returns, benchmark_monthly_r
                 line=dict(width=1, color='white'),
                 opacity=0.7
             ),
-            text=[f"Date: {d.strftime('%b %Y')}<br>Benchmark: {b:.2f}%<br>{comparison_name}: {c:.2f}%"
-                  for d, b, c in zip(dates_comp, bench_comp_pct, comp_pct)],
+            text=_scatter_hover_text(dates_comp, bench_comp_pct, comp_pct, comparison_name),
             hovertemplate='%{text}<extra></extra>',
             name=comparison_name,
             showlegend=True
@@ -3626,7 +3768,6 @@ def create_comparison_metrics_table(strategy_metrics, benchmark_name,
     Returns:
         pd.DataFrame formatted for display
     """
-    import pandas as pd
 
     # Metrics to display
     metric_keys = ['R²', 'Correlation', 'Beta']
@@ -3662,7 +3803,8 @@ def create_sip_portfolio_chart(sip_table_df, strategy_name, benchmark_name, comp
     """
     # Prepare SIP data (remove TOTAL and IRR rows)
     chart_df = sip_table_df.iloc[:-2].copy()
-    chart_df['Date'] = pd.to_datetime(chart_df['Period'] + '-01')
+    # Fixed-format parse takes the fast path and skips the '-01' string concat
+    chart_df['Date'] = pd.to_datetime(chart_df['Period'], format='%Y-%m')
 
     fig = go.Figure()
 
@@ -223,7 +223,7 @@ def calculate_fund_metrics_table(df, risk_free_rate=0.0249, start_date=None, end
             else:
                 # Fallback calculation
                 returns_with_date = group.set_index('date')['returns'].dropna()
-                annual_returns = returns_with_date.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
+                annual_returns = np.expm1(np.log1p(returns_with_date).resample('YE').sum()) * 100
                 annual_returns_list = annual_returns.tolist()
 
             # Get date range
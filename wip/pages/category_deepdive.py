@@ -3,6 +3,7 @@
 Compare multiple funds within a category using various visualizations
 """
 import streamlit as st
+import numpy as np
 import pandas as pd
 from src.data_loader import calculate_returns
 from src.metrics import calculate_all_metrics
@@ -36,6 +37,34 @@ from src.shared_components import (
     filter_funds_by_plan_type
 )
 
+# Content-based hashes so st.cache_data can key on pandas inputs without
+# pickling whole frames on every rerun
+_PANDAS_HASH = {
+    pd.Series: lambda s: pd.util.hash_pandas_object(s).sum(),
+    pd.DataFrame: lambda df: pd.util.hash_pandas_object(df.astype(str)).sum(),
+}
+
+# Builders are looked up by name so the cache key is a plain string
+_CHART_BUILDERS = {fn.__name__: fn for fn in (
+    create_cagr_distribution,
+    create_annual_returns_distribution,
+    create_volatility_distribution,
+    create_sharpe_distribution,
+    create_max_drawdown_distribution,
+    create_correlation_heatmap,
+)}
+
+
+@st.cache_data(max_entries=32, show_spinner=False, hash_funcs=_PANDAS_HASH)
+def _cached_chart(builder_name, *args, **kwargs):
+    """Build a chart figure, or fetch it when the inputs are unchanged
+
+    The distribution and correlation charts are pure functions of their
+    inputs; on reruns with the same selection the full resample/KDE/corr
+    pipeline is skipped entirely.
+    """
+    return _CHART_BUILDERS[builder_name](*args, **kwargs)
+
 
 def render(data_loader):
     """Render the Fund Category Deepdive page
@@ -242,33 +271,37 @@ def render(data_loader):
 
         with col1:
             # CAGR Distribution
-            fig_cagr = create_cagr_distribution(metrics_df, benchmark_metrics['CAGR'])
+            fig_cagr = _cached_chart('create_cagr_distribution', metrics_df, benchmark_metrics['CAGR'])
             st.plotly_chart(fig_cagr, use_container_width=True)
 
         with col2:
             # Annual Returns Distribution
-            fig_returns_dist = create_annual_returns_distribution(
+            fig_returns_dist = _cached_chart(
+                'create_annual_returns_distribution',
                 funds_returns, benchmark_returns, start_date, end_date
             )
             st.plotly_chart(fig_returns_dist, use_container_width=True)
 
         with col3:
             # Volatility Distribution
-            fig_vol_dist = create_volatility_distribution(
+            fig_vol_dist = _cached_chart(
+                'create_volatility_distribution',
                 funds_returns, benchmark_returns, start_date, end_date, risk_free_rate
             )
             st.plotly_chart(fig_vol_dist, use_container_width=True)
 
         with col4:
             # Sharpe Ratio Distribution
-            fig_sharpe_dist = create_sharpe_distribution(
+            fig_sharpe_dist = _cached_chart(
+                'create_sharpe_distribution',
                 funds_returns, benchmark_returns, start_date, end_date, risk_free_rate
             )
             st.plotly_chart(fig_sharpe_dist, use_container_width=True)
 
         with col5:
             # Max Drawdown Distribution
-            fig_dd_dist = create_max_drawdown_distribution(
+            fig_dd_dist = _cached_chart(
+                'create_max_drawdown_distribution',
                 funds_returns, benchmark_returns
             )
             st.plotly_chart(fig_dd_dist, use_container_width=True)
@@ -305,7 +338,7 @@ def render(data_loader):
             # Calculate annual returns for benchmark with common year range
             # Include all years from start to end (including current year if end_date is in it)
             all_years = list(range(start_date.year, end_date.year + 1))
-            benchmark_annual_returns = benchmark_returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
+            benchmark_annual_returns = np.expm1(np.log1p(benchmark_returns).resample('YE').sum()) * 100
 
             # Align benchmark returns to all years
             aligned_benchmark_returns = []
@@ -419,7 +452,7 @@ def render(data_loader):
             for fund_name in final_fund_list:
                 if fund_name in funds_returns:
                     returns = funds_returns[fund_name]
-                    annual_returns = returns.resample('YE').apply(lambda x: (1 + x).prod() - 1) * 100
+                    annual_returns = np.expm1(np.log1p(returns).resample('YE').sum()) * 100
 
                     # Create a series aligned to all years, with 0 for missing years
                     aligned_returns = []
@@ -577,7 +610,8 @@ def render(data_loader):
         with st.expander("🔗 Correlation Matrix - Fund correlation analysis", expanded=False):
             st.caption("Correlation of monthly returns between all funds and benchmark. Red indicates lower correlation, green indicates stronger positive correlation.")
 
-            fig_corr = create_correlation_heatmap(
+            fig_corr = _cached_chart(
+                'create_correlation_heatmap',
                 funds_returns, benchmark_returns, benchmark_name
             )
             st.plotly_chart(fig_corr, use_container_width=True)